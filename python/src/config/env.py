@@ -85,6 +85,10 @@ def validate_numeric_config() -> None:
     if network_retry_limit < 1 or network_retry_limit > 10:
         raise ValueError(f'Invalid NETWORK_RETRY_LIMIT: {os.getenv("NETWORK_RETRY_LIMIT")}. Must be between 1 and 10.')
 
+    clob_max_concurrency = int(os.getenv('CLOB_MAX_CONCURRENCY', '8'))
+    if clob_max_concurrency < 1 or clob_max_concurrency > 32:
+        raise ValueError(f'Invalid CLOB_MAX_CONCURRENCY: {os.getenv("CLOB_MAX_CONCURRENCY")}. Must be between 1 and 32.')
+
 
 def validate_urls() -> None:
     """Validate URL formats"""
@@ -278,6 +282,7 @@ class ENV:
     # Network settings
     REQUEST_TIMEOUT_MS: int = int(os.getenv('REQUEST_TIMEOUT_MS', '10000'))
     NETWORK_RETRY_LIMIT: int = int(os.getenv('NETWORK_RETRY_LIMIT', '3'))
+    CLOB_MAX_CONCURRENCY: int = int(os.getenv('CLOB_MAX_CONCURRENCY', '8'))
     # Trade aggregation settings
     TRADE_AGGREGATION_ENABLED: bool = os.getenv('TRADE_AGGREGATION_ENABLED', '').lower() == 'true'
     TRADE_AGGREGATION_WINDOW_SECONDS: int = int(os.getenv('TRADE_AGGREGATION_WINDOW_SECONDS', '300'))  # 5 minutes default
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import time
-import traceback
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
@@ -107,8 +106,12 @@ def run_error(
         ctx["error_type"] = "Error"
         ctx["error_message"] = str(error)
 
-    # capture stack if not supplied
-    ctx["stack"] = stack if stack is not None else traceback.format_exc()
+    # capture stack if not supplied (traceback only imported on the error path)
+    if stack is None:
+        import traceback
+
+        stack = traceback.format_exc()
+    ctx["stack"] = stack
 
     return RunEvent(
         type="run_error",
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
+import functools
 import json
+import os
 import subprocess
 from dataclasses import dataclass
 from typing import Any, Dict, Optional
 
+from src.utils.json_codec import dumps
+
 
 def canonical_artifact_key(prefix: str, service: str, run_id: str, filename: str) -> str:
     """
@@ -19,10 +23,18 @@ def canonical_artifact_key(prefix: str, service: str, run_id: str, filename: str
     return f"{p}/{service}/{run_id}/{filename}"
 
 
+@functools.lru_cache(maxsize=None)
 def get_git_sha() -> str:
     """
     Best-effort git SHA. Returns 'unknown' if git isn't available.
+
+    GIT_SHA (e.g. baked into a container image) takes precedence and skips
+    the git subprocess. The result is cached for the life of the process.
     """
+    env_sha = (os.getenv("GIT_SHA") or "").strip()
+    if env_sha:
+        return env_sha
+
     try:
         out = subprocess.check_output(["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL)
         return out.decode("utf-8").strip()
@@ -62,4 +74,10 @@ class RunManifest:
         }
 
     def to_json(self) -> str:
-        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
\ No newline at end of file
+        return json.dumps(self.to_dict(), indent=2, sort_keys=True)
+
+    def to_json_bytes(self) -> bytes:
+        """
+        Same document as to_json(), UTF-8 encoded with a trailing newline.
+        """
+        return dumps(self.to_dict(), indent=True, newline=True, sort_keys=True)
@@ -1,23 +1,26 @@
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
 from typing import Dict
 
 from src.services.simulation.pipeline.simulator import ReplayStats
+from src.utils.json_codec import dumps
 
 
-def write_summary(path: Path, stats: ReplayStats) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def write_summary(path: Path | str, stats: ReplayStats) -> None:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
 
     payload: Dict = {
         "version": 1,
         "events_total": stats.events_total,
-        "events_by_type": stats.events_by_type,
+        "events_by_type": dict(stats.events_by_type),
     }
 
-    with path.open("w") as f:
-        json.dump(payload, f, indent=2)
+    with open(path, "wb") as f:
+        f.write(dumps(payload, indent=True))
 
 
 def print_summary(stats: ReplayStats) -> None:
@@ -13,22 +13,22 @@ This service:
 
 from __future__ import annotations
 
-import json
 import os
 import time
-from pathlib import Path
 from typing import Dict
 
-from src.cloud.factory import get_cloud
 from src.config.validate import ConfigError, validate_runtime_config
 from src.metrics import metric
-from src.metrics.writer import MetricsWriter
 from src.observability.events import run_end, run_error, run_start
-from src.services.common.manifest import RunManifest, get_git_sha
 from src.services.simulation.pipeline.reader import read_events
 from src.services.simulation.pipeline.reporter import print_summary, write_summary
 from src.services.simulation.pipeline.simulator import ReplayStats, replay_event_stream
-from src.utils.logger import log_event
+from src.utils.json_codec import dumps
+from src.utils.logger import log_event, log_format_is_json
+
+_EVENTS_PATH = "recorder_data/events.jsonl"
+_LOCAL_SUMMARY_PATH = "simulation_results/replay_summary.json"
+_LOCAL_MANIFEST_PATH = "simulation_results/manifest.json"
 
 
 def _norm_prefix(prefix: str | None) -> str:
@@ -40,7 +40,27 @@ def _join(prefix: str, rel_key: str) -> str:
     return f"{prefix}/{rel_key.strip().lstrip('/')}"
 
 
+def _banner() -> None:
+    # Decorative only: JSON log consumers get nothing from it unless VERBOSE is set.
+    if log_format_is_json() and not os.getenv("VERBOSE"):
+        return
+
+    for line in (
+        "[Phase 1a] Simulation service starting (replay mode).",
+        " - Reads recorder_data/events.jsonl",
+        " - Writes simulation_results/replay_summary.json",
+        " - No execution allowed. No private keys required.",
+    ):
+        log_event({"level": "info", "message": line, "context": {"type": "banner"}})
+
+
 def main() -> int:
+    # Cloud/metrics/manifest wiring is imported here rather than at module
+    # level so importing this module (CLIs, tests) stays cheap.
+    from src.cloud.factory import get_cloud
+    from src.metrics.writer import MetricsWriter
+    from src.services.common.manifest import RunManifest, get_git_sha
+
     # -------------------------
     # Fail-fast runtime config
     # -------------------------
@@ -50,11 +70,7 @@ def main() -> int:
         log_event({"level": "error", "message": f"[Config] {e}", "context": {"type": "config_error"}})
         return 2
 
-    # Banner as structured logs if LOG_FORMAT=json
-    log_event({"level": "info", "message": "[Phase 1a] Simulation service starting (replay mode).", "context": {"type": "banner"}})
-    log_event({"level": "info", "message": " - Reads recorder_data/events.jsonl", "context": {"type": "banner"}})
-    log_event({"level": "info", "message": " - Writes simulation_results/replay_summary.json", "context": {"type": "banner"}})
-    log_event({"level": "info", "message": " - No execution allowed. No private keys required.", "context": {"type": "banner"}})
+    _banner()
 
     cloud = get_cloud()
 
@@ -65,10 +81,6 @@ def main() -> int:
     # Metrics writer (local always; S3 best-effort if configured)
     mw = MetricsWriter(service="simulation", run_id=run_id, env=env)
 
-    events_path = Path("recorder_data") / "events.jsonl"
-    local_summary_path = Path("simulation_results") / "replay_summary.json"
-    local_manifest_path = Path("simulation_results") / "manifest.json"
-
     prefix = _norm_prefix(os.getenv("S3_OBJECT_PREFIX", "polymarket-copy-bot"))
 
     rel_replay_key = f"simulation/{run_id}/replay_summary.json"
@@ -77,18 +89,24 @@ def main() -> int:
     full_replay_key = _join(prefix, rel_replay_key)
     full_manifest_key = _join(prefix, rel_manifest_key)
 
+    cloud_backend = os.getenv("CLOUD_BACKEND", "local")
+    object_store_backend = os.getenv("OBJECT_STORE_BACKEND", "local")
+
+    # Shared by run_start/run_end/run_error; never mutated (run_end/run_error copy it).
+    base_ctx = {
+        "mode": "replay",
+        "inputs": {"events_path": _EVENTS_PATH},
+        "cloud_backend": cloud_backend,
+        "object_store_backend": object_store_backend,
+        "env": env,
+    }
+
     log_event(
         run_start(
             service="simulation",
             run_id=run_id,
             ts=started_at,
-            context={
-                "mode": "replay",
-                "inputs": {"events_path": str(events_path)},
-                "cloud_backend": os.getenv("CLOUD_BACKEND", "local"),
-                "object_store_backend": os.getenv("OBJECT_STORE_BACKEND", "local"),
-                "env": env,
-            },
+            context=base_ctx,
         )
     )
 
@@ -99,7 +117,7 @@ def main() -> int:
         replay_start = time.time()
 
         stats = ReplayStats()
-        for event in read_events(events_path):
+        for event in read_events(_EVENTS_PATH):
             replay_event_stream(stats, event)
 
         replay_end = time.time()
@@ -127,7 +145,7 @@ def main() -> int:
             "version": 1,
             "run_id": run_id,
             "events_total": stats.events_total,
-            "events_by_type": stats.events_by_type,
+            "events_by_type": dict(stats.events_by_type),
         }
 
         # -------------------------
@@ -136,14 +154,14 @@ def main() -> int:
         write_start = time.time()
 
         # Local summary (always)
-        write_summary(local_summary_path, stats)
+        write_summary(_LOCAL_SUMMARY_PATH, stats)
 
         # Best-effort object store replay summary
         s3_ok_summary = True
         try:
             cloud.objects.put_bytes(
                 key=rel_replay_key,
-                data=json.dumps(payload, indent=2).encode("utf-8"),
+                data=dumps(payload, indent=True),
                 content_type="application/json",
             )
         except Exception as e:
@@ -168,32 +186,35 @@ def main() -> int:
             duration_s=finished_at - started_at,
             git_sha=get_git_sha(),
             config={
-                "cloud_backend": os.getenv("CLOUD_BACKEND", "local"),
-                "object_store_backend": os.getenv("OBJECT_STORE_BACKEND", "local"),
+                "cloud_backend": cloud_backend,
+                "object_store_backend": object_store_backend,
                 "aws_region": os.getenv("AWS_REGION"),
                 "s3_bucket": os.getenv("S3_OBJECT_BUCKET"),
                 "s3_prefix": prefix,
-                "inputs": {"events_path": str(events_path)},
+                "inputs": {"events_path": _EVENTS_PATH},
             },
             artifacts={
                 # Keep intended keys for determinism, plus local paths and S3 success flag
                 "replay_summary": full_replay_key,
                 "manifest": full_manifest_key,
-                "local_summary_path": str(local_summary_path),
-                "local_manifest_path": str(local_manifest_path),
+                "local_summary_path": _LOCAL_SUMMARY_PATH,
+                "local_manifest_path": _LOCAL_MANIFEST_PATH,
                 "s3_ok_replay_summary": s3_ok_summary,
             },
         )
+        manifest_bytes = manifest.to_json_bytes()
 
-        local_manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        local_manifest_path.write_text(manifest.to_json() + "\n", encoding="utf-8")
+        # Local manifest (always); the encoded bytes are reused for the object copy
+        os.makedirs(os.path.dirname(_LOCAL_MANIFEST_PATH), exist_ok=True)
+        with open(_LOCAL_MANIFEST_PATH, "wb") as f:
+            f.write(manifest_bytes)
 
         # Best-effort object store manifest
         s3_ok_manifest = True
         try:
             cloud.objects.put_bytes(
                 key=rel_manifest_key,
-                data=(manifest.to_json() + "\n").encode("utf-8"),
+                data=manifest_bytes,
                 content_type="application/json",
             )
         except Exception as e:
@@ -227,7 +248,7 @@ def main() -> int:
                 duration_s=duration_s,
                 ts=finished_at,
                 context={
-                    "mode": "replay",
+                    **base_ctx,
                     "artifacts": {
                         "replay_summary": full_replay_key,
                         "manifest": full_manifest_key,
@@ -261,7 +282,7 @@ def main() -> int:
                 error=e,
                 duration_s=duration_s,
                 ts=finished_at,
-                context={"mode": "replay"},
+                context=base_ctx,
             )
         )
         return 1
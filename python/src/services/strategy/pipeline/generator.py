@@ -1,34 +1,46 @@
 from __future__ import annotations
 
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional
 
 from src.contracts.order_intent import OrderIntent
 
 
-def generate_order_intent(event: Dict) -> Optional[OrderIntent]:
-    """
-    Phase 2: convert a canonical raw-event into an order_intent.
-    Signal-only, no execution.
-
-    Current logic (simple placeholder):
-    - If event type is trade_detected, emit a low-confidence intent.
-    """
-    if event.get("type") != "trade_detected":
-        return None
+_TRADE_DETECTED = "trade_detected"
 
-    market_id = event.get("market_id", "unknown_market")
-    payload = event.get("payload", {}) or {}
 
-    # Placeholder heuristics
-    side = str(payload.get("side", "YES")).upper()
+def _handle_trade_detected(event: Dict) -> OrderIntent:
+    """
+    Emit a low-confidence intent for a detected trade (placeholder heuristics).
+    """
+    payload = event.get("payload") or {}
     price = float(payload.get("price", 0.5))
 
     return OrderIntent(
         version=1,
-        source_event_type=event.get("type", "unknown"),
-        market_id=market_id,
-        side=side,
+        source_event_type=_TRADE_DETECTED,
+        market_id=event.get("market_id", "unknown_market"),
+        side=str(payload.get("side", "YES")).upper(),
         confidence=0.10,           # intentionally low until real strategy added
         max_price=min(price + 0.02, 0.99),  # placeholder
         metadata={"raw_event": event},
     )
+
+
+# event type -> handler; add new event types here instead of branching.
+_HANDLERS: Dict[str, Callable[[Dict], Optional[OrderIntent]]] = {
+    _TRADE_DETECTED: _handle_trade_detected,
+}
+
+
+def generate_order_intent(event: Dict) -> Optional[OrderIntent]:
+    """
+    Phase 2: convert a canonical raw-event into an order_intent.
+    Signal-only, no execution.
+
+    Current logic (simple placeholder):
+    - If event type is trade_detected, emit a low-confidence intent.
+    """
+    handler = _HANDLERS.get(event.get("type"))
+    if handler is None:
+        return None
+    return handler(event)
@@ -1,16 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Dict, Iterator
 
 
-def read_events(path: Path) -> Iterator[Dict]:
-    if not path.exists():
+def read_events(path: Path | str) -> Iterator[Dict]:
+    if not os.path.exists(path):
         return
         yield  # pragma: no cover
 
-    with path.open("r") as f:
+    with open(path, "r") as f:
         for line in f:
             line = line.strip()
             if not line:
@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-import json
+import os
 from pathlib import Path
 from typing import Iterable
 
 from src.contracts.order_intent import OrderIntent
+from src.utils.json_codec import dumps
 
 
-def write_order_intents(path: Path, intents: Iterable[OrderIntent]) -> int:
-    path.parent.mkdir(parents=True, exist_ok=True)
+def write_order_intents(path: Path | str, intents: Iterable[OrderIntent]) -> int:
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
 
     count = 0
-    with path.open("a") as f:
+    with open(path, "ab") as f:
         for intent in intents:
-            f.write(json.dumps(intent.to_dict()) + "\n")
+            # OrderIntent is a dataclass: serialized directly, no to_dict() copy.
+            f.write(dumps(intent, newline=True))
             count += 1
     return count
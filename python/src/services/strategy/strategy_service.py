@@ -13,13 +13,14 @@ This service:
 
 from __future__ import annotations
 
-from pathlib import Path
-
 from src.config.validate import ConfigError, validate_runtime_config
 from src.services.strategy.pipeline.reader import read_events
 from src.services.strategy.pipeline.generator import generate_order_intent
 from src.services.strategy.pipeline.writer import write_order_intents
 
+_EVENTS_PATH = "recorder_data/events.jsonl"
+_OUT_PATH = "strategy_data/order_intents.jsonl"
+
 
 def main() -> int:
     """
@@ -42,19 +43,16 @@ def main() -> int:
     print(" - Emits strategy_data/order_intents.jsonl")
     print(" - No execution allowed. No private keys required.")
 
-    events_path = Path("recorder_data") / "events.jsonl"
-    out_path = Path("strategy_data") / "order_intents.jsonl"
-
     intents = []
     read_count = 0
 
-    for event in read_events(events_path):
+    for event in read_events(_EVENTS_PATH):
         read_count += 1
         intent = generate_order_intent(event)
         if intent is not None:
             intents.append(intent)
 
-    written = write_order_intents(out_path, intents)
+    written = write_order_intents(_OUT_PATH, intents)
 
     print(f"[Strategy] Read events: {read_count}")
     print(f"[Strategy] Wrote intents: {written}")
@@ -58,25 +58,33 @@ if APP_PHASE and APP_PHASE != "4":
 # -----------------------------
 
 import asyncio
+import heapq
 import time
-from typing import List, Dict, Any
+import uuid
+from functools import lru_cache
+from typing import Awaitable, Callable, Iterable, List, Dict, Any, Optional, Tuple
+
+from pymongo import ASCENDING, UpdateOne
 
 from ...config.env import ENV
+from ...config.copy_strategy import OrderSizeCalculation
 from ...models.user_history import get_user_activity_collection
 from ...interfaces.user import UserActivityInterface, UserPositionInterface
 from ...utils.fetch_data import fetch_data_async
-from ...utils.get_my_balance import get_my_balance_async
-from ...utils.post_order import post_order
+from ...utils.get_my_balance import read_usdc_balance
+from ...utils.post_order import post_order, size_buy_order
 from ...utils.logger import (
     success,
     info,
     warning,
+    error,
     header,
     waiting,
     clear_line,
     separator,
     trade as log_trade,
     balance as log_balance,
+    is_info_enabled,
 )
 
 USER_ADDRESSES = ENV.USER_ADDRESSES
@@ -86,42 +94,255 @@ TRADE_AGGREGATION_ENABLED = ENV.TRADE_AGGREGATION_ENABLED
 TRADE_AGGREGATION_WINDOW_SECONDS = ENV.TRADE_AGGREGATION_WINDOW_SECONDS
 TRADE_AGGREGATION_MIN_TOTAL_USD = 1.0  # Polymarket minimum
 
+# address -> collection handle is fixed for the process lifetime; resolve each once
+_coll = lru_cache(maxsize=None)(get_user_activity_collection)
+
+POSITIONS_URL = "https://data-api.polymarket.com/positions?user={}"
+FETCH_CONCURRENCY = 15  # max in-flight data-api requests per batch
+CLOB_MAX_CONCURRENCY = ENV.CLOB_MAX_CONCURRENCY  # max orders being placed at once
+POLL_INTERVAL_SECONDS = 0.3  # fallback DB poll when no new-trade signal arrives
+# Info-level chatter on the poll/execution paths is only formatted when it will be shown
+INFO_ENABLED = is_info_enabled()
+
 is_running = True
+# Set by notify_new_trade() to wake the executor loop early; created inside trade_executor()
+new_trade_event: Optional[asyncio.Event] = None
+
+_time_ns = time.time_ns  # integer clock for aggregation timestamps (no float round-trip)
 
 TradeWithUser = Dict[str, Any]
 AggregatedTrade = Dict[str, Any]
+AggregationKey = Tuple[str, str, str, str]  # (userAddress, conditionId, asset, side)
+
+trade_aggregation_buffer: Dict[AggregationKey, AggregatedTrade] = {}
+# (firstTradeTime, key) min-heap over the buffer, so expiry checks stop at the first unexpired bucket
+aggregation_deadlines: List[Tuple[int, AggregationKey]] = []
+
+# Compound index backing the pending-trade query; ensured once per collection
+PENDING_TRADES_INDEX = [("type", ASCENDING), ("bot", ASCENDING), ("botExcutedTime", ASCENDING)]
+indexed_addresses: set = set()
+
+# botExcutedTime: 0 = pending, CLAIMED = claimed by an executor, PLACING = handed to
+# post_order, 1 = settled. (post_order also stores its retry count there when it gives
+# up, alongside bot: True.) Only CLAIMED trades are ever handed back automatically: a
+# PLACING trade may already be filled, so an interrupted order is never re-bought.
+CLAIMED = -1
+PLACING = -2
+# A claim older than this belongs to an executor that died (restart, crash) before
+# placing it and is handed back to the pending pool. Buffered trades legitimately
+# stay claimed for the aggregation window, so it only counts when aggregation is on.
+CLAIM_GRACE_SECONDS = 60
+CLAIM_STALE_MS = (
+    (TRADE_AGGREGATION_WINDOW_SECONDS if TRADE_AGGREGATION_ENABLED else 0) + CLAIM_GRACE_SECONDS
+) * 1000
+CLAIM_RECOVERY_INTERVAL_SECONDS = 60
+
+# Claimed trades this process still owns (buffered or executing); stale-claim
+# recovery never touches these.
+held_trade_ids: set = set()
+
+# Query documents are built once here and shared by every poll (pymongo doesn't mutate them).
+_PENDING_FILTER: Dict[str, Any] = {"type": "TRADE", "bot": False, "botExcutedTime": 0}
+_CLAIMED_FILTER: Dict[str, Any] = {"type": "TRADE", "bot": False, "botExcutedTime": CLAIMED}
+_COMMIT_UPDATE: Dict[str, Any] = {"$set": {"botExcutedTime": 1}, "$unset": {"claimId": "", "claimedAt": ""}}
+_RELEASE_UPDATE: Dict[str, Any] = {"$set": {"botExcutedTime": 0}, "$unset": {"claimId": "", "claimedAt": ""}}
+# Every field the executor and post_order read; the rest of the activity row stays on the server
+_TRADE_PROJECTION: Dict[str, int] = {
+    "_id": 1,
+    "side": 1,
+    "usdcSize": 1,
+    "price": 1,
+    "conditionId": 1,
+    "asset": 1,
+    "slug": 1,
+    "eventSlug": 1,
+    "outcome": 1,
+    "transactionHash": 1,
+}
+
+# Small BUYs go to the aggregation buffer, everything else executes immediately.
+# The two filters are exact complements (a missing usdcSize counts as 0).
+AGGREGATABLE_FILTER: Dict[str, Any] = {
+    **_PENDING_FILTER,
+    "side": "BUY",
+    "usdcSize": {"$not": {"$gte": TRADE_AGGREGATION_MIN_TOTAL_USD}},
+}
+IMMEDIATE_FILTER: Dict[str, Any] = {
+    **_PENDING_FILTER,
+    "$or": [{"side": {"$ne": "BUY"}}, {"usdcSize": {"$gte": TRADE_AGGREGATION_MIN_TOTAL_USD}}],
+}
+
+
+def claim_pending_trades(address: str, query_filter: Dict[str, Any] = _PENDING_FILTER) -> List[TradeWithUser]:
+    """
+    Claim and return one trader's unprocessed trades (blocking; run off the event loop)
+
+    A single update_many moves matching trades from botExcutedTime 0 to CLAIMED
+    and tags them with this claim's id; only rows carrying that id are then read back.
+    A trade is therefore handed to exactly one executor, and trades waiting in the
+    aggregation buffer are not re-read on later polls. The claim ends with
+    mark_placing + commit_claims / mark_trades, or release_claims / release_stale_claims.
+    """
+    collection = _coll(address)
+
+    if address not in indexed_addresses:
+        try:
+            collection.create_index(PENDING_TRADES_INDEX)
+        except Exception as e:
+            warning(f"Could not create pending-trades index for {address}: {e}")
+        indexed_addresses.add(address)
+
+    claim_id = uuid.uuid4().hex
+    result = collection.update_many(
+        query_filter,
+        {"$set": {"botExcutedTime": CLAIMED, "claimedAt": _time_ns() // 1_000_000, "claimId": claim_id}},
+    )
+    if not result.modified_count:
+        return []
+
+    # Stamp each document as the cursor yields it (one pass, no intermediate list)
+    trades: List[TradeWithUser] = []
+    for trade in collection.find({**_CLAIMED_FILTER, "claimId": claim_id}, projection=_TRADE_PROJECTION):
+        trade["userAddress"] = address
+        held_trade_ids.add(trade["_id"])
+        trades.append(trade)
+
+    return trades
+
+
+def release_stale_claims(address: str, held: List[Any]) -> int:
+    """
+    Hand abandoned claims back to the pending pool (blocking; run off the event loop)
+
+    Resets trades claimed longer than CLAIM_STALE_MS ago that never reached post_order
+    and are not held by this process to botExcutedTime 0. Returns how many were reset.
+    """
+    query: Dict[str, Any] = {**_CLAIMED_FILTER, "claimedAt": {"$lt": _time_ns() // 1_000_000 - CLAIM_STALE_MS}}
+    if held:
+        query["_id"] = {"$nin": held}
+    return _coll(address).update_many(query, _RELEASE_UPDATE).modified_count
+
+
+async def recover_stale_claims() -> None:
+    """Release abandoned claims for every trader (at startup and every CLAIM_RECOVERY_INTERVAL_SECONDS)"""
+    held = list(held_trade_ids)
+    results = await asyncio.gather(
+        *(asyncio.to_thread(release_stale_claims, address, held) for address in USER_ADDRESSES),
+        return_exceptions=True,
+    )
+    released = 0
+    for address, result in zip(USER_ADDRESSES, results):
+        if isinstance(result, Exception):
+            warning(f"Could not release stale trade claims for {address}: {result}")
+        else:
+            released += result
+    if released:
+        warning(f"Released {released} abandoned trade claim(s) back to pending")
 
-trade_aggregation_buffer: Dict[str, AggregatedTrade] = {}
 
+async def read_temp_trades() -> Tuple[List[TradeWithUser], List[TradeWithUser]]:
+    """
+    Claim unprocessed trades from database (concurrent queries per trader)
 
-async def read_temp_trades() -> List[TradeWithUser]:
-    """Read unprocessed trades from database"""
-    all_trades: List[TradeWithUser] = []
+    Returns (immediate, aggregatable). With aggregation disabled every trade
+    is immediate and a single query per trader is issued.
+    """
+    if not TRADE_AGGREGATION_ENABLED:
+        results = await asyncio.gather(
+            *(asyncio.to_thread(claim_pending_trades, address) for address in USER_ADDRESSES)
+        )
+        return [trade for trades in results for trade in trades], []
 
-    for address in USER_ADDRESSES:
-        collection = get_user_activity_collection(address)
-        trades = list(
-            collection.find(
-                {
-                    "type": "TRADE",
-                    "bot": False,
-                    "botExcutedTime": 0,
-                }
-            )
+    results = await asyncio.gather(
+        *(
+            asyncio.to_thread(claim_pending_trades, address, query_filter)
+            for address in USER_ADDRESSES
+            for query_filter in (IMMEDIATE_FILTER, AGGREGATABLE_FILTER)
+        )
+    )
+    immediate = [trade for trades in results[0::2] for trade in trades]
+    aggregatable = [trade for trades in results[1::2] for trade in trades]
+    return immediate, aggregatable
+
+
+def mark_trades(trades: List[TradeWithUser], fields: Dict[str, Any]) -> None:
+    """Settle claimed trades with the same fields set on each, one bulk_write per user collection"""
+    _bulk_update(trades, {}, {"$set": {"botExcutedTime": 1, **fields}, "$unset": _COMMIT_UPDATE["$unset"]})
+
+
+def mark_placing(trades: List[TradeWithUser]) -> None:
+    """Move claimed trades to PLACING just before post_order; recovery never touches them again"""
+    _bulk_update(trades, {"botExcutedTime": CLAIMED}, {"$set": {"botExcutedTime": PLACING}})
+
+
+def commit_claims(trades: List[TradeWithUser]) -> None:
+    """Mark placed trades executed (botExcutedTime 1) and drop their claim"""
+    _bulk_update(trades, {"botExcutedTime": PLACING}, _COMMIT_UPDATE)
+
+
+def release_claims(trades: List[TradeWithUser]) -> None:
+    """Hand claimed trades back to the pending pool (botExcutedTime 0)"""
+    _bulk_update(trades, {"botExcutedTime": CLAIMED}, _RELEASE_UPDATE)
+
+
+def _bulk_update(trades: List[TradeWithUser], match: Dict[str, Any], update: Dict[str, Any]) -> None:
+    # Every caller settles the trades it is given, so this process stops holding them
+    ops_by_address: Dict[str, List[UpdateOne]] = {}
+    for trade in trades:
+        held_trade_ids.discard(trade["_id"])
+        ops_by_address.setdefault(trade["userAddress"], []).append(
+            UpdateOne({"_id": trade["_id"], **match}, update)
         )
 
-        for trade in trades:
-            trade["userAddress"] = address
-            all_trades.append(trade)
+    for address, ops in ops_by_address.items():
+        _coll(address).bulk_write(ops, ordered=False)
 
-    return all_trades
 
+async def fetch_batch_state(
+    user_addresses: Iterable[str],
+) -> Tuple[List[Dict[str, Any]], Dict[str, List[Dict[str, Any]]], float]:
+    """
+    Fetch my positions, my balance and each distinct trader's positions
+    concurrently, once per batch.
 
-def get_aggregation_key(trade: TradeWithUser) -> str:
+    Returns (my_positions, positions_by_user_address, my_balance).
+    """
+    sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+
+    async def fetch_positions(address: str) -> List[Dict[str, Any]]:
+        async with sem:
+            data = await fetch_data_async(POSITIONS_URL.format(address))
+        return data if isinstance(data, list) else []
+
+    async def fetch_balance() -> float:
+        async with sem:
+            # Web3's HTTPProvider call blocks; keep it off the loop so the position fetches overlap it
+            return await asyncio.to_thread(read_usdc_balance, PROXY_WALLET)
+
+    users = list(dict.fromkeys(user_addresses))
+    my_positions_list, my_balance, *user_lists = await asyncio.gather(
+        fetch_positions(PROXY_WALLET),
+        fetch_balance(),
+        *(fetch_positions(address) for address in users),
+    )
+    return my_positions_list, dict(zip(users, user_lists)), my_balance
+
+
+def index_by_condition(positions: List[Dict[str, Any]]) -> Dict[Any, Dict[str, Any]]:
+    """Map conditionId -> position (first occurrence wins)"""
+    index: Dict[Any, Dict[str, Any]] = {}
+    for position in positions:
+        index.setdefault(position.get("conditionId"), position)
+    return index
+
+
+def get_aggregation_key(trade: TradeWithUser) -> AggregationKey:
     """Generate a unique key for trade aggregation based on user, market, side"""
     return (
-        f"{trade['userAddress']}:{trade.get('conditionId', '')}:"
-        f"{trade.get('asset', '')}:{trade.get('side', 'BUY')}"
+        trade["userAddress"],
+        trade.get("conditionId") or "",  # never None: keys are ordered on deadline ties
+        trade.get("asset") or "",
+        trade.get("side", "BUY"),
     )
 
 
@@ -129,17 +350,16 @@ def add_to_aggregation_buffer(trade: TradeWithUser) -> None:
     """Add trade to aggregation buffer or update existing aggregation"""
     key = get_aggregation_key(trade)
     existing = trade_aggregation_buffer.get(key)
-    now = int(time.time() * 1000)  # milliseconds
+    now = _time_ns() // 1_000_000  # milliseconds
 
     if existing:
         existing["trades"].append(trade)
         existing["totalUsdcSize"] += trade.get("usdcSize", 0)
+        # Running sum of usdcSize * price, so the weighted average is O(1) per insert
+        existing["totalValue"] += trade.get("usdcSize", 0) * trade.get("price", 0)
 
-        total_value = sum(
-            t.get("usdcSize", 0) * t.get("price", 0) for t in existing["trades"]
-        )
         existing["averagePrice"] = (
-            total_value / existing["totalUsdcSize"]
+            existing["totalValue"] / existing["totalUsdcSize"]
             if existing["totalUsdcSize"] > 0
             else 0
         )
@@ -154,27 +374,41 @@ def add_to_aggregation_buffer(trade: TradeWithUser) -> None:
             "eventSlug": trade.get("eventSlug"),
             "trades": [trade],
             "totalUsdcSize": trade.get("usdcSize", 0),
+            "totalValue": trade.get("usdcSize", 0) * trade.get("price", 0),
             "averagePrice": trade.get("price", 0),
             "firstTradeTime": now,
             "lastTradeTime": now,
         }
+        heapq.heappush(aggregation_deadlines, (now, key))
+
+        # Wake the executor when this bucket is due rather than waiting for its next poll
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.call_later(TRADE_AGGREGATION_WINDOW_SECONDS, notify_new_trade)
 
 
 def get_ready_aggregated_trades() -> List[AggregatedTrade]:
     """Check buffer and return ready aggregated trades"""
     ready: List[AggregatedTrade] = []
-    now = int(time.time() * 1000)
+    now = _time_ns() // 1_000_000
     window_ms = TRADE_AGGREGATION_WINDOW_SECONDS * 1000
 
-    keys_to_remove = []
+    skipped_trades: List[TradeWithUser] = []
 
-    for key, agg in trade_aggregation_buffer.items():
-        time_elapsed = now - agg["firstTradeTime"]
+    while aggregation_deadlines and now - aggregation_deadlines[0][0] >= window_ms:
+        first_trade_time, key = heapq.heappop(aggregation_deadlines)
+        agg = trade_aggregation_buffer.get(key)
+        if agg is None or agg["firstTradeTime"] != first_trade_time:
+            continue  # stale entry: bucket already flushed
 
-        if time_elapsed >= window_ms:
-            if agg["totalUsdcSize"] >= TRADE_AGGREGATION_MIN_TOTAL_USD:
-                ready.append(agg)
-            else:
+        del trade_aggregation_buffer[key]
+
+        if agg["totalUsdcSize"] >= TRADE_AGGREGATION_MIN_TOTAL_USD:
+            ready.append(agg)
+        else:
+            if INFO_ENABLED:
                 info(
                     f"Trade aggregation for {agg['userAddress']} on "
                     f"{agg.get('slug') or agg.get('asset', 'unknown')}: "
@@ -182,24 +416,179 @@ def get_ready_aggregated_trades() -> List[AggregatedTrade]:
                     f"trades below minimum (${TRADE_AGGREGATION_MIN_TOTAL_USD}) - skipping"
                 )
 
-                for trade in agg["trades"]:
-                    collection = get_user_activity_collection(trade["userAddress"])
-                    collection.update_one({"_id": trade["_id"]}, {"$set": {"bot": True}})
+            skipped_trades.extend(agg["trades"])
 
-            keys_to_remove.append(key)
-
-    for key in keys_to_remove:
-        del trade_aggregation_buffer[key]
+    if skipped_trades:
+        mark_trades(skipped_trades, {"bot": True})
 
     return ready
 
 
+async def run_per_market(items: List[Dict[str, Any]], execute: Callable[[Dict[str, Any]], Awaitable[None]]) -> None:
+    """
+    Run execute(item) for every item: concurrently across (userAddress, conditionId)
+    markets, in order within a market, with at most CLOB_MAX_CONCURRENCY in flight.
+
+    Markets are started in conditionId order so orders for the same market
+    (across traders) go out back to back. A failed item is logged and skipped;
+    cancellation still propagates.
+    """
+    sem = asyncio.Semaphore(CLOB_MAX_CONCURRENCY)
+    by_market: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+    # Stable sort: items of one market keep their original relative order
+    for item in sorted(items, key=lambda i: (i.get("conditionId") or "", i["userAddress"])):
+        by_market.setdefault((item["userAddress"], item.get("conditionId") or ""), []).append(item)
+
+    async def run_market(market_items: List[Dict[str, Any]]) -> None:
+        for item in market_items:
+            async with sem:
+                try:
+                    await execute(item)
+                except Exception as e:
+                    # One failed order must not abort the rest of the batch
+                    error(
+                        f"Order for {item['userAddress']} on "
+                        f"{item.get('slug') or item.get('conditionId') or 'unknown'} failed: {e}"
+                    )
+
+    await asyncio.gather(*(run_market(market_items) for market_items in by_market.values()))
+
+
+class BuyLedger:
+    """
+    One batch's USDC balance, shared by its concurrently placed orders.
+
+    Each BUY is sized against what is left and its amount reserved before the
+    order goes out; whatever it didn't spend is given back afterwards. Sizing
+    and reserving never await, so two orders can't size against the same
+    balance while the orders themselves are still placed concurrently.
+    """
+
+    def __init__(self, balance: float) -> None:
+        self.balance = balance
+        self._reserved: Dict[Any, float] = {}
+
+    def position(self, condition_id: Any, position: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """my_position as sizing should see it, including this batch's earlier BUYs"""
+        reserved = self._reserved.get(condition_id)
+        if not reserved:
+            return position
+        # Sizing only reads size * avgPrice (the position value)
+        avg_price = position.get("avgPrice") if position else None
+        if avg_price:
+            return {**position, "size": position.get("size", 0) + reserved / avg_price}
+        return {**(position or {"conditionId": condition_id}), "size": reserved, "avgPrice": 1.0}
+
+    def reserve(
+        self, trade: TradeWithUser, position: Optional[Dict[str, Any]]
+    ) -> Tuple[OrderSizeCalculation, float, float]:
+        """Size a BUY and take its amount off; returns (order_calc, balance sized against, amount reserved)"""
+        condition_id = trade.get("conditionId")
+        balance = self.balance
+        order_calc = size_buy_order(trade, self.position(condition_id, position), balance)
+        # post_order never spends more than the balance it is given (a below-minimum
+        # size is bumped up to the minimum even when nothing is left)
+        reserved = min(order_calc.final_amount, max(balance, 0.0))
+        self._adjust(condition_id, reserved)
+        return order_calc, balance, reserved
+
+    def release(self, condition_id: Any, reserved: float, spent: float) -> None:
+        """Give back the part of a reservation that wasn't spent"""
+        if reserved > spent:
+            self._adjust(condition_id, spent - reserved)
+
+    def _adjust(self, condition_id: Any, amount: float) -> None:
+        self.balance -= amount
+        self._reserved[condition_id] = self._reserved.get(condition_id, 0.0) + amount
+
+
+async def place_order(
+    clob_client: Any,
+    ledger: BuyLedger,
+    my_index: Dict[Any, Dict[str, Any]],
+    trade: TradeWithUser,
+    user_position: Optional[Dict[str, Any]],
+    user_balance: float,
+    claimed: List[TradeWithUser],
+) -> None:
+    """post_order one (possibly aggregated) trade, then settle the claimed trades it covers"""
+    condition_id = trade.get("conditionId")
+    my_position = my_index.get(condition_id)
+    log_balance(ledger.balance, user_balance, trade["userAddress"])
+    mark_placing(claimed)
+    try:
+        if trade.get("side") == "BUY":
+            order_calc, balance, reserved = ledger.reserve(trade, my_position)
+            spent = await post_order(
+                clob_client,
+                "buy",
+                my_position,
+                user_position,
+                trade,
+                balance,
+                user_balance,
+                trade["userAddress"],
+                order_calc=order_calc,
+            )
+            ledger.release(condition_id, reserved, spent)
+        else:
+            await post_order(
+                clob_client,
+                "sell",
+                my_position,
+                user_position,
+                trade,
+                ledger.balance,
+                user_balance,
+                trade["userAddress"],
+            )
+    except Exception as e:
+        # Part of the order may already be filled: settle it as failed, never retry it.
+        # (A cancelled order stays PLACING for the same reason.) Its reservation is kept.
+        mark_trades(claimed, {"bot": True, "botError": str(e) or type(e).__name__})
+        raise
+    commit_claims(claimed)
+
+
 async def do_trading(clob_client: Any, trades: List[TradeWithUser]) -> None:
-    """Execute trades"""
+    """Execute trades (already claimed by read_temp_trades)"""
+    # A trade without a market can't be matched to any position: drop it before fetching
+    unmatched = [trade for trade in trades if not trade.get("conditionId")]
+    if unmatched:
+        for trade in unmatched:
+            warning(f"Trade {trade['_id']} from {trade['userAddress']} has no conditionId - skipping")
+        mark_trades(unmatched, {"bot": True})
+        trades = [trade for trade in trades if trade.get("conditionId")]
+        if not trades:
+            return
+
+    my_positions_list, positions_by_user, my_balance = await fetch_batch_state(
+        trade["userAddress"] for trade in trades
+    )
+    my_index = index_by_condition(my_positions_list)
+    user_indexes = {address: index_by_condition(lst) for address, lst in positions_by_user.items()}
+    ledger = BuyLedger(my_balance)
+
+    # Selling a market we hold nothing in is a no-op; settle those without post_order
+    not_held: List[TradeWithUser] = []
+
+    to_execute: List[TradeWithUser] = []
+
     for trade in trades:
-        collection = get_user_activity_collection(trade["userAddress"])
-        collection.update_one({"_id": trade["_id"]}, {"$set": {"botExcutedTime": 1}})
+        if trade.get("side") == "SELL" and trade["conditionId"] not in my_index:
+            if INFO_ENABLED:
+                info(
+                    f"Trader sold {trade.get('slug') or trade.get('asset', 'unknown')} "
+                    f"but we hold no position - skipping"
+                )
+            not_held.append(trade)
+        else:
+            to_execute.append(trade)
+
+    if not_held:
+        mark_trades(not_held, {"bot": True})
 
+    async def execute(trade: TradeWithUser) -> None:
         log_trade(
             trade["userAddress"],
             trade.get("side", "UNKNOWN"),
@@ -214,115 +603,111 @@ async def do_trading(clob_client: Any, trades: List[TradeWithUser]) -> None:
             },
         )
 
-        my_positions_data = await fetch_data_async(
-            f"https://data-api.polymarket.com/positions?user={PROXY_WALLET}"
-        )
-        user_positions_data = await fetch_data_async(
-            f"https://data-api.polymarket.com/positions?user={trade['userAddress']}"
-        )
+        user_positions_list = positions_by_user[trade["userAddress"]]
 
-        my_positions_list = my_positions_data if isinstance(my_positions_data, list) else []
-        user_positions_list = (
-            user_positions_data if isinstance(user_positions_data, list) else []
-        )
+        user_position = user_indexes[trade["userAddress"]].get(trade["conditionId"])
 
-        my_position = next(
-            (p for p in my_positions_list if p.get("conditionId") == trade.get("conditionId")),
-            None,
-        )
-        user_position = next(
-            (p for p in user_positions_list if p.get("conditionId") == trade.get("conditionId")),
-            None,
-        )
-
-        my_balance = await get_my_balance_async(PROXY_WALLET)
         user_balance = sum(pos.get("currentValue", 0) or 0 for pos in user_positions_list)
 
-        log_balance(my_balance, user_balance, trade["userAddress"])
-
-        await post_order(
-            clob_client,
-            "buy" if trade.get("side") == "BUY" else "sell",
-            my_position,
-            user_position,
-            trade,
-            my_balance,
-            user_balance,
-            trade["userAddress"],
-        )
+        await place_order(clob_client, ledger, my_index, trade, user_position, user_balance, [trade])
 
         separator()
 
+    await run_per_market(to_execute, execute)
 
-async def do_aggregated_trading(clob_client: Any, aggregated_trades: List[AggregatedTrade]) -> None:
-    """Execute aggregated trades"""
-    for agg in aggregated_trades:
-        header(f"AGGREGATED TRADE ({len(agg['trades'])} trades combined)")
-        info(f"Market: {agg.get('slug') or agg.get('asset', 'unknown')}")
-        info(f"Side: {agg.get('side', 'BUY')}")
-        info(f"Total volume: ${agg['totalUsdcSize']:.2f}")
-        info(f"Average price: ${agg['averagePrice']:.4f}")
 
-        for trade in agg["trades"]:
-            collection = get_user_activity_collection(trade["userAddress"])
-            collection.update_one({"_id": trade["_id"]}, {"$set": {"botExcutedTime": 1}})
+async def do_aggregated_trading(clob_client: Any, aggregated_trades: List[AggregatedTrade]) -> None:
+    """Execute aggregated trades (already claimed by read_temp_trades)"""
+    my_positions_list, positions_by_user, my_balance = await fetch_batch_state(
+        agg["userAddress"] for agg in aggregated_trades
+    )
+    my_index = index_by_condition(my_positions_list)
+    user_indexes = {address: index_by_condition(lst) for address, lst in positions_by_user.items()}
+    ledger = BuyLedger(my_balance)
 
-        my_positions_data = await fetch_data_async(
-            f"https://data-api.polymarket.com/positions?user={PROXY_WALLET}"
-        )
-        user_positions_data = await fetch_data_async(
-            f"https://data-api.polymarket.com/positions?user={agg['userAddress']}"
-        )
+    async def execute(agg: AggregatedTrade) -> None:
+        header(f"AGGREGATED TRADE ({len(agg['trades'])} trades combined)")
+        if INFO_ENABLED:
+            info(f"Market: {agg.get('slug') or agg.get('asset', 'unknown')}")
+            info(f"Side: {agg.get('side', 'BUY')}")
+            info(f"Total volume: ${agg['totalUsdcSize']:.2f}")
+            info(f"Average price: ${agg['averagePrice']:.4f}")
 
-        my_positions_list = my_positions_data if isinstance(my_positions_data, list) else []
-        user_positions_list = (
-            user_positions_data if isinstance(user_positions_data, list) else []
-        )
+        user_positions_list = positions_by_user[agg["userAddress"]]
 
-        my_position = next(
-            (p for p in my_positions_list if p.get("conditionId") == agg.get("conditionId")),
-            None,
-        )
-        user_position = next(
-            (p for p in user_positions_list if p.get("conditionId") == agg.get("conditionId")),
-            None,
-        )
+        user_position = user_indexes[agg["userAddress"]].get(agg.get("conditionId"))
 
-        my_balance = await get_my_balance_async(PROXY_WALLET)
         user_balance = sum(pos.get("currentValue", 0) or 0 for pos in user_positions_list)
 
-        log_balance(my_balance, user_balance, agg["userAddress"])
-
+        # Only the fields post_order reads (_id marks the status row, asset picks the book)
+        # plus the identifying ones; the first trade's full activity doc isn't copied.
         synthetic_trade: TradeWithUser = {
-            **agg["trades"][0],
+            "_id": agg["trades"][0]["_id"],
+            "userAddress": agg["userAddress"],
+            "conditionId": agg["conditionId"],
+            "asset": agg["asset"],
+            "slug": agg.get("slug"),
+            "eventSlug": agg.get("eventSlug"),
+            "outcome": agg["trades"][0].get("outcome"),
             "usdcSize": agg["totalUsdcSize"],
             "price": agg["averagePrice"],
             "side": agg.get("side", "BUY"),
         }
 
-        await post_order(
-            clob_client,
-            "buy" if agg.get("side", "BUY") == "BUY" else "sell",
-            my_position,
-            user_position,
-            synthetic_trade,
-            my_balance,
-            user_balance,
-            agg["userAddress"],
-        )
+        # post_order only marks the first trade; the rest of the bucket is settled with it
+        await place_order(clob_client, ledger, my_index, synthetic_trade, user_position, user_balance, agg["trades"])
 
         separator()
 
+    await run_per_market(aggregated_trades, execute)
+
+
+@lru_cache(maxsize=64)
+def pending_groups_note(buffered_count: int) -> str:
+    """Idle-status suffix; the same few counts repeat on every poll, so reuse the strings"""
+    return f"{buffered_count} trade group(s) pending"
+
+
+def notify_new_trade() -> None:
+    """Wake the executor loop now instead of at its next poll (call after inserting a trade)"""
+    if new_trade_event is not None:
+        new_trade_event.set()
+
+
+async def wait_for_new_trade() -> None:
+    """Block until notify_new_trade() is called or the poll interval elapses"""
+    try:
+        await asyncio.wait_for(new_trade_event.wait(), timeout=POLL_INTERVAL_SECONDS)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        new_trade_event.clear()
+
 
 def stop_trade_executor() -> None:
     """Stop the trade executor gracefully"""
     global is_running
     is_running = False
     info("Trade executor shutdown requested...")
+    notify_new_trade()
+
+    # Buffered trades only exist in memory: hand them back so the next start picks them up
+    buffered = [trade for agg in trade_aggregation_buffer.values() for trade in agg["trades"]]
+    trade_aggregation_buffer.clear()
+    aggregation_deadlines.clear()
+    if buffered:
+        try:
+            release_claims(buffered)
+            info(f"Released {len(buffered)} buffered trade(s) back to pending")
+        except Exception as e:
+            warning(f"Could not release buffered trades: {e}")
 
 
 async def trade_executor(clob_client: Any) -> None:
     """Main trade executor function"""
+    global new_trade_event
+    new_trade_event = asyncio.Event()
+
     success(f"Trade executor ready for {len(USER_ADDRESSES)} trader(s)")
     if TRADE_AGGREGATION_ENABLED:
         info(
@@ -330,27 +715,35 @@ async def trade_executor(clob_client: Any) -> None:
             f"${TRADE_AGGREGATION_MIN_TOTAL_USD} minimum"
         )
 
-    last_check = time.time()
+    await recover_stale_claims()
+    last_check = last_recovery = time.time()
 
     while is_running:
-        trades = await read_temp_trades()
+        if time.time() - last_recovery >= CLAIM_RECOVERY_INTERVAL_SECONDS:
+            await recover_stale_claims()
+            last_recovery = time.time()
+
+        trades, aggregatable = await read_temp_trades()
 
         if TRADE_AGGREGATION_ENABLED:
-            if trades:
+            new_count = len(trades) + len(aggregatable)
+            if new_count:
                 clear_line()
-                info(f"{len(trades)} new trade{'s' if len(trades) > 1 else ''} detected")
+                if INFO_ENABLED:
+                    info(f"{new_count} new trade{'s' if new_count > 1 else ''} detected")
 
-                for trade in trades:
-                    if trade.get("side") == "BUY" and trade.get("usdcSize", 0) < TRADE_AGGREGATION_MIN_TOTAL_USD:
+                for trade in aggregatable:
+                    if INFO_ENABLED:
                         info(
                             f"Adding ${trade.get('usdcSize', 0):.2f} {trade.get('side', 'BUY')} trade "
                             f"to aggregation buffer for {trade.get('slug') or trade.get('asset', 'unknown')}"
                         )
-                        add_to_aggregation_buffer(trade)
-                    else:
-                        clear_line()
-                        header("IMMEDIATE TRADE (above threshold)")
-                        await do_trading(clob_client, [trade])
+                    add_to_aggregation_buffer(trade)
+
+                if trades:
+                    clear_line()
+                    header(f"{len(trades)} IMMEDIATE TRADE{'S' if len(trades) > 1 else ''} (above threshold)")
+                    await do_trading(clob_client, trades)
 
                 last_check = time.time()
 
@@ -364,11 +757,11 @@ async def trade_executor(clob_client: Any) -> None:
                 await do_aggregated_trading(clob_client, ready_aggregations)
                 last_check = time.time()
 
-            if not trades and not ready_aggregations:
-                if time.time() - last_check > 0.3:
+            if not new_count and not ready_aggregations:
+                if INFO_ENABLED and time.time() - last_check > 0.3:
                     buffered_count = len(trade_aggregation_buffer)
                     if buffered_count > 0:
-                        waiting(len(USER_ADDRESSES), f"{buffered_count} trade group(s) pending")
+                        waiting(len(USER_ADDRESSES), pending_groups_note(buffered_count))
                     else:
                         waiting(len(USER_ADDRESSES))
                     last_check = time.time()
@@ -379,13 +772,13 @@ async def trade_executor(clob_client: Any) -> None:
                 await do_trading(clob_client, trades)
                 last_check = time.time()
             else:
-                if time.time() - last_check > 0.3:
+                if INFO_ENABLED and time.time() - last_check > 0.3:
                     waiting(len(USER_ADDRESSES))
                     last_check = time.time()
 
         if not is_running:
             break
 
-        await asyncio.sleep(0.3)
+        await wait_for_new_trade()
 
     info("Trade executor stopped")
\ No newline at end of file
@@ -57,13 +57,13 @@ if APP_PHASE and APP_PHASE != "4":
 # -----------------------------
 
 import asyncio
-import json
 import websockets
 from typing import List, Dict, Any, Optional
 
 from ...config.env import ENV
 from ...models.user_history import get_user_activity_collection, get_user_position_collection
 from ...utils.fetch_data import fetch_data_async
+from ...utils.json_codec import loads  # orjson when installed; parse RTDS messages with this
 from ...utils.logger import (
     info, success, warning, error, db_connection, my_positions,
     traders_positions, clear_line
@@ -101,6 +101,8 @@ async def init():
 async def process_trade_activity(activity: Dict[str, Any], address: str):
     """Process an activity message and persist relevant updates."""
     # TODO: restore real trade activity processing here.
+    # After inserting a new TRADE row, call trade_executor.notify_new_trade()
+    # so the executor picks it up without waiting for its next poll.
     raise NotImplementedError("Phase 4+ trade_monitor processing not implemented yet.")
 
 
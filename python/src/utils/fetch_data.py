@@ -5,6 +5,7 @@ import asyncio
 import httpx
 from typing import Any
 from ..config.env import ENV
+from .json_codec import loads
 
 
 def is_network_error(error: Exception) -> bool:
@@ -33,7 +34,7 @@ async def fetch_data_async(url: str) -> Any:
                     },
                 )
                 response.raise_for_status()
-                return response.json()
+                return loads(response.content)
         except Exception as error:
             is_last_attempt = attempt == retries
 
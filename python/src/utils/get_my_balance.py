@@ -16,8 +16,8 @@ USDC_ABI = [
 ]
 
 
-async def get_my_balance_async(address: str) -> float:
-    """Get USDC balance for an address (async)"""
+def read_usdc_balance(address: str) -> float:
+    """Get USDC balance for an address (blocking RPC call; run off the event loop)"""
     w3 = Web3(Web3.HTTPProvider(ENV.RPC_URL))
     # Convert address to checksum format
     checksum_address = Web3.to_checksum_address(address)
@@ -29,6 +29,11 @@ async def get_my_balance_async(address: str) -> float:
     return float(balance_usdc_real)
 
 
+async def get_my_balance_async(address: str) -> float:
+    """Get USDC balance for an address (async)"""
+    return read_usdc_balance(address)
+
+
 def get_my_balance(address: str) -> float:
     """Get USDC balance for an address (sync wrapper)"""
     import asyncio
@@ -0,0 +1,96 @@
+"""
+JSON encode/decode helpers
+
+Uses orjson when it is installed (single C-level pass, emits bytes, serializes
+dataclasses natively) and falls back to the stdlib json module otherwise.
+Callers always get bytes from dumps(), whichever backend is active.
+
+For ordinary values (str/int/float/bool/None, lists, dicts, dataclasses) the
+fallback produces the same bytes as orjson. Known differences:
+- floats needing an exponent: 1e16 is "1e+16" from json, "1e16" from orjson
+- NaN / Infinity: json emits NaN / Infinity, orjson emits null
+- ints beyond 64 bits: json encodes them, orjson raises TypeError
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import fields, is_dataclass
+from typing import Any, Callable, Optional
+
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+
+HAS_ORJSON = orjson is not None
+
+
+def _stdlib_default(obj: Any) -> Any:
+    # Shallow field walk; json recurses into the values itself.
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(
+    obj: Any,
+    *,
+    indent: bool = False,
+    newline: bool = False,
+    sort_keys: bool = False,
+    non_str_keys: bool = False,
+    default: Optional[Callable[[Any], Any]] = None,
+) -> bytes:
+    """
+    Serialize obj to UTF-8 JSON bytes.
+
+    indent:       pretty-print with 2-space indentation
+    newline:      append a trailing "\\n" (JSONL / text files)
+    sort_keys:    emit dict keys in sorted order
+    non_str_keys: allow int/float/bool/None dict keys (stringified)
+    default:      fallback for types the encoder doesn't know
+    """
+    if orjson is not None:
+        option = 0
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        if non_str_keys:
+            option |= orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(obj, default=default, option=option)
+
+    if default is None:
+        fallback = _stdlib_default
+    else:
+        def fallback(o: Any) -> Any:
+            if is_dataclass(o) and not isinstance(o, type):
+                return _stdlib_default(o)
+            return default(o)
+
+    # Matches orjson for ordinary values (see module docstring for the exceptions):
+    # compact separators, raw UTF-8 rather than \u escapes
+    text = json.dumps(
+        obj,
+        indent=2 if indent else None,
+        separators=None if indent else (",", ":"),
+        ensure_ascii=False,
+        sort_keys=sort_keys,
+        default=fallback,
+    )
+    if newline:
+        text += "\n"
+    return text.encode("utf-8")
+
+
+def loads(data: bytes | bytearray | str) -> Any:
+    """
+    Parse JSON from bytes or str.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -3,55 +3,115 @@ Logger utility with colored output and file logging
 + Optional structured JSON logging (LOG_FORMAT=json) for PR20 observability
 
 Key behaviors:
-- LOG_FORMAT=text (default): human-friendly colored console output + daily log file
+- LOG_FORMAT=text (default): human-friendly console output + daily log file
+  (colored only on a TTY; NO_COLOR disables colors)
 - LOG_FORMAT=json: one JSON object per line to stdout/stderr + daily log file
+- LOG_FILE=0: skip the daily log file entirely (console output only)
 - BrokenPipe-safe: piping to `head` / `jq` won't crash the process
 """
 
 from __future__ import annotations
 
-import json
+import atexit
 import os
 import sys
-from datetime import datetime
+import threading
+import time
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from ..observability.events import RunEvent
+from .json_codec import dumps
 
 
 # -------------------------
-# Config (read env at runtime, not import-time)
+# Config (read once at import; use set_log_format to switch at runtime)
 # -------------------------
 LOG_DIR = Path(os.getenv("LOG_DIR", "logs"))
-LOG_DIR.mkdir(parents=True, exist_ok=True)
+# LOG_FILE=0: console only (e.g. containers whose runtime already collects stdout)
+_FILE_LOGGING_ENABLED = os.getenv("LOG_FILE", "1").strip() != "0"
+if _FILE_LOGGING_ENABLED:
+    LOG_DIR.mkdir(parents=True, exist_ok=True)
 
+_LOG_FORMAT_IS_JSON = os.getenv("LOG_FORMAT", "text").lower().strip() == "json"  # "text" | "json"
 
-def _log_format() -> str:
-    return os.getenv("LOG_FORMAT", "text").lower().strip()  # "text" | "json"
 
+def set_log_format(fmt: str) -> None:
+    """
+    Switch between "text" and "json" output after import.
 
-def _now_iso() -> str:
-    return datetime.now().isoformat()
+    Colors are chosen at import time, so switching json -> text prints uncolored text.
+    """
+    global _LOG_FORMAT_IS_JSON
+    _LOG_FORMAT_IS_JSON = fmt.lower().strip() == "json"
+
+
+def log_format_is_json() -> bool:
+    return _LOG_FORMAT_IS_JSON
 
 
-def _now_ts() -> float:
-    return datetime.now().timestamp()
+# LOG_LEVEL=warning silences info/success (and the info-level helpers below).
+# Unknown levels rank like info.
+_LEVEL_RANK: Dict[str, int] = {"debug": 0, "info": 10, "success": 10, "warning": 20, "error": 30}
+_MIN_LEVEL = _LEVEL_RANK.get(os.getenv("LOG_LEVEL", "info").lower().strip(), 10)
+_INFO_ENABLED = _MIN_LEVEL <= 10
 
 
-def _safe_json(obj: Any) -> Any:
+def is_level_enabled(level: str) -> bool:
+    return _LEVEL_RANK.get(level, 10) >= _MIN_LEVEL
+
+
+def is_info_enabled() -> bool:
     """
-    Best-effort JSON conversion for arbitrary objects.
+    True unless LOG_LEVEL mutes info; lets callers skip building expensive messages/contexts.
+    """
+    return _INFO_ENABLED
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS", "HH:MM:SS"); local-time strings are only
+# re-formatted when the second changes.
+_ts_cache: Tuple[int, str, str] = (-1, "", "")
+
+
+def _ts_now() -> Tuple[float, str, str]:
+    """
+    Returns (epoch seconds, local ISO-8601 with milliseconds, "HH:MM:SS").
+    """
+    global _ts_cache
+    t = time.time()
+    sec = int(t)
+    cache = _ts_cache
+    if cache[0] != sec:
+        lt = time.localtime(sec)
+        cache = (sec, time.strftime("%Y-%m-%dT%H:%M:%S", lt), time.strftime("%H:%M:%S", lt))
+        _ts_cache = cache
+    return t, f"{cache[1]}.{int((t - sec) * 1000):03d}", cache[2]
+
+
+def _now_iso() -> str:
+    return _ts_now()[1]
+
+
+def _json_default(obj: Any) -> Any:
+    """
+    Best-effort fallback for values the JSON encoder can't represent natively.
     """
-    if obj is None:
-        return None
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-    if isinstance(obj, (list, tuple)):
-        return [_safe_json(x) for x in obj]
-    if isinstance(obj, dict):
-        return {str(k): _safe_json(v) for k, v in obj.items()}
     return str(obj)
 
 
+def _encode_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    Encode a log payload as one newline-terminated JSON line in a single
+    serializer pass (unknown types -> str).
+    """
+    try:
+        return dumps(payload, newline=True, non_str_keys=True, default=_json_default)
+    except (TypeError, ValueError):
+        # e.g. tuple keys or out-of-range ints: keep the line, stringify the context
+        return dumps({**payload, "context": str(payload.get("context"))}, newline=True)
+
+
 # -------------------------
 # Colors (TEXT mode only)
 # -------------------------
@@ -66,7 +126,18 @@ class _NoColorStyle:
 Fore = _NoColorFore  # type: ignore
 Style = _NoColorStyle  # type: ignore
 
-if _log_format() != "json":
+def _wants_color() -> bool:
+    # https://no-color.org: any non-empty NO_COLOR disables color. Pipes and
+    # redirects get plain text too (consumers would strip the codes anyway).
+    if _LOG_FORMAT_IS_JSON or os.getenv("NO_COLOR"):
+        return False
+    try:
+        return sys.stdout.isatty()
+    except Exception:
+        return False
+
+
+if _wants_color():
     # Only initialize colorama when we intend to print colored text.
     try:
         from colorama import init as _colorama_init, Fore as _Fore, Style as _Style  # type: ignore
@@ -78,39 +149,176 @@ if _log_format() != "json":
         # Keep no-color fallbacks
         pass
 
+_HAS_COLOR = Fore is not _NoColorFore
+
+_RULE_EQ = "=" * 70
+_RULE_DASH = "-" * 70
+_RULE_LIGHT = "─" * 70
+
+# level -> (console prefix, log file label); the table is picked once at import
+# so the no-color path never interpolates empty color codes.
+_PLAIN_PREFIXES: Dict[str, Tuple[str, str]] = {
+    "info": ("[INFO] ", "INFO: "),
+    "success": ("[SUCCESS] ", "SUCCESS: "),
+    "warning": ("[WARNING] ", "WARNING: "),
+    "error": ("[ERROR] ", "ERROR: "),
+}
+if _HAS_COLOR:
+    _LEVEL_PREFIXES: Dict[str, Tuple[str, str]] = {
+        "info": (f"{Fore.BLUE}[INFO]{Style.RESET_ALL} ", "INFO: "),
+        "success": (f"{Fore.GREEN}[SUCCESS]{Style.RESET_ALL} ", "SUCCESS: "),
+        "warning": (f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} ", "WARNING: "),
+        "error": (f"{Fore.RED}[ERROR]{Style.RESET_ALL} ", "ERROR: "),
+    }
+else:
+    _LEVEL_PREFIXES = _PLAIN_PREFIXES
+_NO_PREFIX = ("", "")
+_SEPARATOR_LINE = f"{Style.DIM}{_RULE_DASH}{Style.RESET_ALL}" if _HAS_COLOR else _RULE_DASH
+
 
 # -------------------------
 # File logging
 # -------------------------
+# (path, time at which it goes stale): the daily path is rebuilt once per local
+# day instead of on every log line.
+_log_path_cache: Tuple[Path, float] = (LOG_DIR / "bot-init.log", 0.0)
+
+
 def get_log_file_name() -> Path:
-    date = datetime.now().strftime("%Y-%m-%d")
-    return LOG_DIR / f"bot-{date}.log"
+    global _log_path_cache
+    path, valid_until = _log_path_cache
+    now = time.time()
+    if now < valid_until:
+        return path
+    lt = time.localtime(now)
+    path = LOG_DIR / f"bot-{time.strftime('%Y-%m-%d', lt)}.log"
+    # Next local midnight (mktime normalizes day overflow and handles DST)
+    next_midnight = time.mktime((lt.tm_year, lt.tm_mon, lt.tm_mday + 1, 0, 0, 0, 0, 0, -1))
+    _log_path_cache = (path, next_midnight)
+    return path
+
+
+# Log lines are queued by callers and written by a background thread, either
+# every _LOG_FLUSH_INTERVAL_S or as soon as _LOG_FLUSH_BYTES are pending.
+# The daily log file is opened once (raw O_APPEND fd, no Python-level buffer)
+# and kept open until the date rolls over.
+_LOG_FLUSH_INTERVAL_S = 0.2
+_LOG_FLUSH_BYTES = 8192
+
+_log_queue: Deque[Tuple[Path, bytes]] = deque()
+_log_queue_bytes = 0  # approximate; only used to decide when to wake the flusher
+_log_wakeup = threading.Event()
+_log_flusher: Optional[threading.Thread] = None
+_log_flusher_start_lock = threading.Lock()
+
+_log_fd: Optional[int] = None
+_log_fd_path: Optional[Path] = None
+_log_fd_lock = threading.Lock()
+
+
+def _write_log_chunks(log_file: Path, chunks: List[bytes]) -> None:
+    global _log_fd, _log_fd_path
+    try:
+        if _log_fd is None or log_file != _log_fd_path:
+            if _log_fd is not None:
+                os.close(_log_fd)
+                _log_fd = None
+            log_file.parent.mkdir(parents=True, exist_ok=True)
+            _log_fd = os.open(log_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            _log_fd_path = log_file
+        data = memoryview(b"".join(chunks))
+        while data:
+            data = data[os.write(_log_fd, data):]
+    except Exception:
+        pass
 
 
-def write_to_file(message: str) -> None:
+def flush_log_file() -> None:
     """
-    Write a plain text line to the daily log file.
+    Write every queued log line to disk now.
     """
+    global _log_queue_bytes
+    with _log_fd_lock:
+        _log_queue_bytes = 0
+        batch_file: Optional[Path] = None
+        chunks: List[bytes] = []
+        while _log_queue:
+            log_file, data = _log_queue.popleft()
+            if log_file != batch_file and chunks:
+                _write_log_chunks(batch_file, chunks)  # type: ignore[arg-type]
+                chunks = []
+            batch_file = log_file
+            chunks.append(data)
+        if chunks:
+            _write_log_chunks(batch_file, chunks)  # type: ignore[arg-type]
+
+
+def _log_flusher_loop() -> None:
+    while True:
+        _log_wakeup.wait(_LOG_FLUSH_INTERVAL_S)
+        _log_wakeup.clear()
+        flush_log_file()
+
+
+def _start_log_flusher() -> None:
+    global _log_flusher
+    with _log_flusher_start_lock:
+        if _log_flusher is None:
+            _log_flusher = threading.Thread(target=_log_flusher_loop, name="log-flusher", daemon=True)
+            _log_flusher.start()
+
+
+def _append_to_log_file(data: bytes) -> None:
+    global _log_queue_bytes
+    if not _FILE_LOGGING_ENABLED:
+        return
     try:
-        log_file = get_log_file_name()
-        log_entry = f"[{_now_iso()}] {message}\n"
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        log_file.open("a", encoding="utf-8").write(log_entry)
+        # Resolve the file now so a line written before midnight lands in that day's file
+        _log_queue.append((get_log_file_name(), data))
     except Exception:
-        pass
+        return
+    _log_queue_bytes += len(data)
+    if _log_flusher is None:
+        _start_log_flusher()
+    if _log_queue_bytes >= _LOG_FLUSH_BYTES:
+        _log_wakeup.set()
+
+
+def _close_log_file() -> None:
+    global _log_fd
+    flush_log_file()
+    with _log_fd_lock:
+        if _log_fd is not None:
+            try:
+                os.close(_log_fd)
+            except Exception:
+                pass
+            _log_fd = None
+
+
+atexit.register(_close_log_file)
+
+
+def write_to_file(message: str) -> None:
+    """
+    Write a plain text line to the daily log file.
+    """
+    if not _FILE_LOGGING_ENABLED:
+        return
+    _append_to_log_file(f"[{_now_iso()}] {message}\n".encode("utf-8"))
 
 
 def write_json_to_file(payload: Dict[str, Any]) -> None:
     """
     Write a JSON payload as a single line to the daily log file.
     """
+    if not _FILE_LOGGING_ENABLED:
+        return
     try:
-        log_file = get_log_file_name()
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        with log_file.open("a", encoding="utf-8") as f:
-            f.write(json.dumps(payload) + "\n")
+        line = dumps(payload, newline=True)
     except Exception:
-        pass
+        return
+    _append_to_log_file(line)
 
 
 # -------------------------
@@ -119,7 +327,14 @@ def write_json_to_file(payload: Dict[str, Any]) -> None:
 def _print_safe(text: str, *, stream: Any) -> None:
     """
     Print that won't explode if the consumer closes the pipe (e.g. `| head`, `| jq`).
+
+    Without colors the line is encoded once and written as bytes (one write +
+    flush instead of print's text, newline and flush). Colored output keeps
+    print() so colorama's stream wrapper still sees it.
     """
+    if not _HAS_COLOR:
+        _write_bytes_safe(f"{text}\n".encode("utf-8"), stream=stream)
+        return
     try:
         print(text, file=stream, flush=True)
     except BrokenPipeError:
@@ -127,56 +342,74 @@ def _print_safe(text: str, *, stream: Any) -> None:
         return
 
 
+def _write_bytes_safe(data: bytes, *, stream: Any) -> None:
+    """
+    Write already-encoded UTF-8 bytes to the stream's binary buffer, skipping
+    the text layer's per-line encode. Streams without a buffer (e.g. StringIO
+    in tests) get the decoded text instead.
+    """
+    try:
+        buf = getattr(stream, "buffer", None)
+        if buf is not None:
+            # Push out any text other code print()ed without flushing, so
+            # output order is kept (no syscall when nothing is pending).
+            stream.flush()
+            buf.write(data)
+            buf.flush()
+        else:
+            stream.write(data.decode("utf-8"))
+            stream.flush()
+    except BrokenPipeError:
+        return
+
+
 def _emit(level: str, message: str, *, context: Optional[Dict[str, Any]] = None) -> None:
     """
     Unified log output.
 
     If LOG_FORMAT=json:
-      - emit JSON to stdout/stderr (stderr only for error)
+      - emit JSON to stdout/stderr (stderr only for error); "context" is
+        omitted when empty
       - also append JSON line to daily log file
 
     If LOG_FORMAT=text:
       - emit colored message like before
       - also append plain text line to daily log file
     """
-    fmt = _log_format()
-    context = context or {}
     lvl = str(level).lower()
+    if _LEVEL_RANK.get(lvl, 10) < _MIN_LEVEL:
+        return
 
-    if fmt == "json":
+    if _LOG_FORMAT_IS_JSON:
+        ts, ts_iso, _ = _ts_now()
+        # A fresh dict per line is deliberate: it's freed by refcount right after
+        # encoding, and pooling/reusing it measured within noise of this.
         payload: Dict[str, Any] = {
-            "ts": _now_ts(),
-            "ts_iso": _now_iso(),
+            "ts": ts,
+            "ts_iso": ts_iso,
             "level": lvl,
             "message": str(message),
-            "context": _safe_json(context),
         }
-        stream = sys.stderr if lvl == "error" else sys.stdout
-        _print_safe(json.dumps(payload), stream=stream)
-        write_json_to_file(payload)
-        return
-
-    # TEXT mode
-    if lvl == "info":
-        _print_safe(f"{Fore.BLUE}[INFO]{Style.RESET_ALL} {message}", stream=sys.stdout)
-        write_to_file(f"INFO: {message}")
-    elif lvl == "success":
-        _print_safe(f"{Fore.GREEN}[SUCCESS]{Style.RESET_ALL} {message}", stream=sys.stdout)
-        write_to_file(f"SUCCESS: {message}")
-    elif lvl == "warning":
-        _print_safe(f"{Fore.YELLOW}[WARNING]{Style.RESET_ALL} {message}", stream=sys.stdout)
-        write_to_file(f"WARNING: {message}")
-    elif lvl == "error":
-        _print_safe(f"{Fore.RED}[ERROR]{Style.RESET_ALL} {message}", stream=sys.stderr)
-        write_to_file(f"ERROR: {message}")
-    else:
-        _print_safe(str(message), stream=sys.stdout)
-        write_to_file(str(message))
+        if context:
+            payload["context"] = context
+        line = _encode_payload(payload)
+        _write_bytes_safe(line, stream=sys.stderr if lvl == "error" else sys.stdout)
+        _append_to_log_file(line)
+        return
+
+    # TEXT mode (streams are looked up per call so redirected sys.stdout/stderr are honoured)
+    console_prefix, file_label = _LEVEL_PREFIXES.get(lvl, _NO_PREFIX)
+    message = str(message)
+    _print_safe(console_prefix + message, stream=sys.stderr if lvl == "error" else sys.stdout)
+    write_to_file(file_label + message)
 
 
 # -------------------------
 # Public helpers (PR20)
 # -------------------------
+_EMPTY_CONTEXT: Dict[str, Any] = {}  # shared default; never mutated
+
+
 def log_event(event: Any) -> None:
     """
     Emit a canonical event (RunEvent from src/observability/events.py) or dict-like object.
@@ -185,25 +418,31 @@ def log_event(event: Any) -> None:
       - we merge event.context into top-level context
       - we keep the full event under context.event for traceability
     """
-    if hasattr(event, "to_dict"):
-        payload = event.to_dict()  # type: ignore[attr-defined]
+    if isinstance(event, RunEvent):
+        if not _LOG_FORMAT_IS_JSON:
+            # Text output only shows level + message; no need for the dict form.
+            _emit(event.level, event.message)
+            return
+        payload = event.to_dict()
     elif isinstance(event, dict):
         payload = event
+    elif hasattr(event, "to_dict"):
+        payload = event.to_dict()
     else:
         payload = {"level": "info", "message": str(event), "context": {}}
 
     level = str(payload.get("level", "info")).lower()
     message = str(payload.get("message", ""))
-    ev_ctx = payload.get("context", {})
+    if not _LOG_FORMAT_IS_JSON:
+        _emit(level, message)
+        return
+
+    ev_ctx = payload.get("context", _EMPTY_CONTEXT)
     if not isinstance(ev_ctx, dict):
         ev_ctx = {"context": str(ev_ctx)}
-
-    if _log_format() == "json":
-        merged: Dict[str, Any] = {"event": payload}
-        merged.update(ev_ctx)
-        _emit(level, message, context=merged)
-    else:
-        _emit(level, message, context=ev_ctx)
+    merged: Dict[str, Any] = {"event": payload}
+    merged.update(ev_ctx)
+    _emit(level, message, context=merged)
 
 
 # -------------------------
@@ -218,13 +457,14 @@ def mask_address(address: str) -> str:
 
 
 def header(title: str) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit("info", "HEADER", context={"title": title})
         return
 
-    _print_safe(f"\n{Fore.CYAN}{Style.BRIGHT}{'=' * 70}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.CYAN}{Style.BRIGHT}  {title}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.CYAN}{Style.BRIGHT}{'=' * 70}{Style.RESET_ALL}\n", stream=sys.stdout)
+    rule = f"{Fore.CYAN}{Style.BRIGHT}{_RULE_EQ}{Style.RESET_ALL}"
+    _print_safe(f"\n{rule}\n{Fore.CYAN}{Style.BRIGHT}  {title}{Style.RESET_ALL}\n{rule}\n", stream=sys.stdout)
     write_to_file(f"HEADER: {title}")
 
 
@@ -245,7 +485,9 @@ def error(message: str, *, context: Optional[Dict[str, Any]] = None) -> None:
 
 
 def trade(trader_address: str, action: str, details: dict) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit(
             "info",
             "NEW_TRADE_DETECTED",
@@ -253,30 +495,34 @@ def trade(trader_address: str, action: str, details: dict) -> None:
         )
         return
 
-    _print_safe(f"\n{Fore.MAGENTA}{'-' * 70}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.MAGENTA}{Style.BRIGHT}NEW TRADE DETECTED{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.MAGENTA}{'-' * 70}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Trader: {Fore.CYAN}{format_address(trader_address)}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Action: {Style.BRIGHT}{action}{Style.RESET_ALL}", stream=sys.stdout)
+    # Built up and written once so the block can't interleave with other output.
+    lines = [
+        f"\n{Fore.MAGENTA}{_RULE_DASH}{Style.RESET_ALL}",
+        f"{Fore.MAGENTA}{Style.BRIGHT}NEW TRADE DETECTED{Style.RESET_ALL}",
+        f"{Fore.MAGENTA}{_RULE_DASH}{Style.RESET_ALL}",
+        f"Trader: {Fore.CYAN}{format_address(trader_address)}{Style.RESET_ALL}",
+        f"Action: {Style.BRIGHT}{action}{Style.RESET_ALL}",
+    ]
 
     if details.get("asset"):
-        _print_safe(f"Asset:  {Style.DIM}{format_address(details['asset'])}{Style.RESET_ALL}", stream=sys.stdout)
+        lines.append(f"Asset:  {Style.DIM}{format_address(details['asset'])}{Style.RESET_ALL}")
     if details.get("side"):
         side_color = Fore.GREEN if details["side"] == "BUY" else Fore.RED
-        _print_safe(f"Side:   {side_color}{Style.BRIGHT}{details['side']}{Style.RESET_ALL}", stream=sys.stdout)
+        lines.append(f"Side:   {side_color}{Style.BRIGHT}{details['side']}{Style.RESET_ALL}")
     if details.get("amount"):
-        _print_safe(f"Amount: {Fore.YELLOW}${details['amount']:.2f}{Style.RESET_ALL}", stream=sys.stdout)
+        lines.append(f"Amount: {Fore.YELLOW}${details['amount']:.2f}{Style.RESET_ALL}")
     if details.get("price"):
-        _print_safe(f"Price:  {Fore.CYAN}${details['price']:.4f}{Style.RESET_ALL}", stream=sys.stdout)
+        lines.append(f"Price:  {Fore.CYAN}${details['price']:.4f}{Style.RESET_ALL}")
     if details.get("eventSlug") or details.get("slug"):
         slug = details.get("eventSlug") or details.get("slug")
         market_url = f"https://polymarket.com/event/{slug}"
-        _print_safe(f"Market: {Fore.BLUE}{market_url}{Style.RESET_ALL}", stream=sys.stdout)
+        lines.append(f"Market: {Fore.BLUE}{market_url}{Style.RESET_ALL}")
     if details.get("transactionHash"):
         tx_url = f"https://polygonscan.com/tx/{details['transactionHash']}"
-        _print_safe(f"TX:     {Fore.BLUE}{tx_url}{Style.RESET_ALL}", stream=sys.stdout)
+        lines.append(f"TX:     {Fore.BLUE}{tx_url}{Style.RESET_ALL}")
 
-    _print_safe(f"{Fore.MAGENTA}{'-' * 70}{Style.RESET_ALL}\n", stream=sys.stdout)
+    lines.append(f"{Fore.MAGENTA}{_RULE_DASH}{Style.RESET_ALL}\n")
+    _print_safe("\n".join(lines), stream=sys.stdout)
 
     trade_log = f"TRADE: {format_address(trader_address)} - {action}"
     if details.get("side"):
@@ -293,7 +539,9 @@ def trade(trader_address: str, action: str, details: dict) -> None:
 
 
 def balance(my_balance: float, trader_balance: float, trader_address: str) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit(
             "info",
             "BALANCE",
@@ -301,30 +549,34 @@ def balance(my_balance: float, trader_balance: float, trader_address: str) -> No
         )
         return
 
-    _print_safe("Capital (USDC + Positions):", stream=sys.stdout)
-    _print_safe(f"  Your total capital:   {Fore.GREEN}{Style.BRIGHT}${my_balance:.2f}{Style.RESET_ALL}", stream=sys.stdout)
     _print_safe(
+        "Capital (USDC + Positions):\n"
+        f"  Your total capital:   {Fore.GREEN}{Style.BRIGHT}${my_balance:.2f}{Style.RESET_ALL}\n"
         f"  Trader total capital: {Fore.BLUE}{Style.BRIGHT}${trader_balance:.2f}{Style.RESET_ALL} ({format_address(trader_address)})",
         stream=sys.stdout,
     )
 
 
 def order_result(success_flag: bool, message: str) -> None:
-    if _log_format() == "json":
+    if success_flag and not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit("info" if success_flag else "error", "ORDER_RESULT", context={"ok": success_flag, "message": message})
         return
 
     if success_flag:
-        _print_safe(f"{Fore.GREEN}[SUCCESS]{Style.RESET_ALL} Order executed: {message}", stream=sys.stdout)
+        _print_safe(f"{_LEVEL_PREFIXES['success'][0]}Order executed: {message}", stream=sys.stdout)
         write_to_file(f"ORDER SUCCESS: {message}")
     else:
-        _print_safe(f"{Fore.RED}[ERROR]{Style.RESET_ALL} Order failed: {message}", stream=sys.stderr)
+        _print_safe(f"{_LEVEL_PREFIXES['error'][0]}Order failed: {message}", stream=sys.stderr)
         write_to_file(f"ORDER FAILED: {message}")
 
 
 def monitoring(trader_count: int) -> None:
-    ts_hms = datetime.now().strftime("%H:%M:%S")
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    ts_hms = _ts_now()[2]
+    if _LOG_FORMAT_IS_JSON:
         _emit("info", "MONITORING", context={"trader_count": trader_count, "ts_hms": ts_hms})
         return
     _print_safe(
@@ -334,14 +586,16 @@ def monitoring(trader_count: int) -> None:
 
 
 def startup(traders: List[str], my_wallet: str) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit("info", "STARTUP", context={"traders": traders, "my_wallet": my_wallet})
         return
 
     title = "COPY TRADING BOT"
     tagline = "Copy the best, automate success"
 
-    border = "=" * 70
+    border = _RULE_EQ
     banner = f"""
 {Fore.CYAN}{Style.BRIGHT}{border}{Style.RESET_ALL}
 {Fore.CYAN}{Style.BRIGHT}={Style.RESET_ALL}{'':^68}{Fore.CYAN}{Style.BRIGHT}={Style.RESET_ALL}
@@ -351,42 +605,49 @@ def startup(traders: List[str], my_wallet: str) -> None:
 {Fore.CYAN}{Style.BRIGHT}={Style.RESET_ALL}{'':^68}{Fore.CYAN}{Style.BRIGHT}={Style.RESET_ALL}
 {Fore.CYAN}{Style.BRIGHT}{border}{Style.RESET_ALL}
 """
-    _print_safe(banner, stream=sys.stdout)
-    _print_safe(f"{Fore.CYAN}{Style.BRIGHT}{'─' * 70}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.CYAN}{Style.BRIGHT}Tracking Traders:{Style.RESET_ALL}", stream=sys.stdout)
-    for index, address in enumerate(traders, 1):
-        _print_safe(f"  {index}. {Style.DIM}{address}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(
-        f"\n{Fore.CYAN}{Style.BRIGHT}Your Wallet:{Style.RESET_ALL} {Style.DIM}{mask_address(my_wallet)}{Style.RESET_ALL}\n",
-        stream=sys.stdout,
-    )
+    lines = [
+        banner,
+        f"{Fore.CYAN}{Style.BRIGHT}{_RULE_LIGHT}{Style.RESET_ALL}",
+        f"{Fore.CYAN}{Style.BRIGHT}Tracking Traders:{Style.RESET_ALL}",
+    ]
+    lines.extend(f"  {index}. {Style.DIM}{address}{Style.RESET_ALL}" for index, address in enumerate(traders, 1))
+    lines.append(f"\n{Fore.CYAN}{Style.BRIGHT}Your Wallet:{Style.RESET_ALL} {Style.DIM}{mask_address(my_wallet)}{Style.RESET_ALL}\n")
+    _print_safe("\n".join(lines), stream=sys.stdout)
 
 
 def db_connection(traders: List[str], counts: List[int]) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit("info", "DB_CONNECTION", context={"traders": traders, "counts": counts})
         return
 
-    _print_safe(f"\n{Fore.CYAN}Database Status:{Style.RESET_ALL}", stream=sys.stdout)
-    for address, count in zip(traders, counts):
-        _print_safe(f"  {format_address(address)}: {Fore.YELLOW}{count}{Style.RESET_ALL} trades", stream=sys.stdout)
-    _print_safe("", stream=sys.stdout)
+    lines = [f"\n{Fore.CYAN}Database Status:{Style.RESET_ALL}"]
+    lines.extend(
+        f"  {format_address(address)}: {Fore.YELLOW}{count}{Style.RESET_ALL} trades" for address, count in zip(traders, counts)
+    )
+    lines.append("")
+    _print_safe("\n".join(lines), stream=sys.stdout)
 
 
 def separator() -> None:
-    if _log_format() == "json":
-        _emit("info", "SEPARATOR", context={})
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
+        _emit("info", "SEPARATOR")
         return
-    _print_safe(f"{Style.DIM}{'-' * 70}{Style.RESET_ALL}", stream=sys.stdout)
+    _print_safe(_SEPARATOR_LINE, stream=sys.stdout)
 
 
 def waiting(trader_count: int, extra_info: Optional[str] = None) -> None:
-    ts_hms = datetime.now().strftime("%H:%M:%S")
+    if not _INFO_ENABLED:
+        return
+    ts_hms = _ts_now()[2]
     msg = f"Waiting for trades from {trader_count} trader(s)"
     if extra_info:
         msg += f" ({extra_info})"
 
-    if _log_format() == "json":
+    if _LOG_FORMAT_IS_JSON:
         _emit("info", "WAITING", context={"trader_count": trader_count, "extra_info": extra_info, "ts_hms": ts_hms})
         return
 
@@ -401,7 +662,7 @@ def waiting(trader_count: int, extra_info: Optional[str] = None) -> None:
 
 
 def clear_line() -> None:
-    if _log_format() == "json":
+    if _LOG_FORMAT_IS_JSON:
         return
     try:
         sys.stdout.write("\r" + " " * 100 + "\r")
@@ -419,7 +680,9 @@ def my_positions(
     initial_value: float,
     current_balance: float,
 ) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit(
             "info",
             "MY_POSITIONS",
@@ -435,46 +698,64 @@ def my_positions(
         )
         return
 
-    _print_safe(f"\n{Fore.MAGENTA}{Style.BRIGHT}Your Positions{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.MAGENTA}{'-' * 70}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Wallet: {Style.DIM}{format_address(wallet)}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe("", stream=sys.stdout)
-
     total_portfolio = current_balance + total_value
-    _print_safe(f"Available Cash:    {Fore.YELLOW}{Style.BRIGHT}${current_balance:.2f}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Total Portfolio:   {Fore.CYAN}{Style.BRIGHT}${total_portfolio:.2f}{Style.RESET_ALL}", stream=sys.stdout)
+    lines = [
+        f"\n{Fore.MAGENTA}{Style.BRIGHT}Your Positions{Style.RESET_ALL}",
+        f"{Fore.MAGENTA}{_RULE_DASH}{Style.RESET_ALL}",
+        f"Wallet: {Style.DIM}{format_address(wallet)}{Style.RESET_ALL}",
+        "",
+        f"Available Cash:    {Fore.YELLOW}{Style.BRIGHT}${current_balance:.2f}{Style.RESET_ALL}",
+        f"Total Portfolio:   {Fore.CYAN}{Style.BRIGHT}${total_portfolio:.2f}{Style.RESET_ALL}",
+    ]
 
     if count == 0:
-        _print_safe(f"\n{Style.DIM}No open positions{Style.RESET_ALL}\n", stream=sys.stdout)
+        lines.append(f"\n{Style.DIM}No open positions{Style.RESET_ALL}\n")
+        _print_safe("\n".join(lines), stream=sys.stdout)
         return
 
     pnl_sign = "+" if overall_pnl >= 0 else ""
     pnl_color = Fore.GREEN if overall_pnl >= 0 else Fore.RED
 
-    _print_safe("", stream=sys.stdout)
-    _print_safe(f"Open Positions:    {Fore.GREEN}{count}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Invested:          {Style.DIM}${initial_value:.2f}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Current Value:     {Fore.CYAN}${total_value:.2f}{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"Profit/Loss:       {pnl_color}{pnl_sign}{overall_pnl:.1f}%{Style.RESET_ALL}", stream=sys.stdout)
+    lines += [
+        "",
+        f"Open Positions:    {Fore.GREEN}{count}{Style.RESET_ALL}",
+        f"Invested:          {Style.DIM}${initial_value:.2f}{Style.RESET_ALL}",
+        f"Current Value:     {Fore.CYAN}${total_value:.2f}{Style.RESET_ALL}",
+        f"Profit/Loss:       {pnl_color}{pnl_sign}{overall_pnl:.1f}%{Style.RESET_ALL}",
+    ]
 
     if top_positions:
-        _print_safe(f"\n{Style.DIM}Top Positions:{Style.RESET_ALL}", stream=sys.stdout)
-        for pos in top_positions:
-            pnl_sign2 = "+" if pos.get("percentPnl", 0) >= 0 else ""
-            avg_price = pos.get("avgPrice", 0)
-            cur_price = pos.get("curPrice", 0)
-            title = (pos.get("title", "") or "")[:45]
-            if len(pos.get("title", "") or "") > 45:
-                title += "..."
-            _print_safe(f'  {pos.get("outcome", "")} - {Style.DIM}{title}{Style.RESET_ALL}', stream=sys.stdout)
-            pnl_value = pos.get("percentPnl", 0)
-            pnl_color_pos = Fore.CYAN if pnl_value >= 0 else Fore.RED
-            _print_safe(
-                f'    Value: ${pos.get("currentValue", 0):.2f} | PnL: {pnl_color_pos}{pnl_sign2}{pnl_value:.1f}%{Style.RESET_ALL}',
-                stream=sys.stdout,
-            )
-            _print_safe(f"    Bought @ {(avg_price * 100):.1f}¢ | Current @ {(cur_price * 100):.1f}¢", stream=sys.stdout)
-    _print_safe("", stream=sys.stdout)
+        lines.append(f"\n{Style.DIM}Top Positions:{Style.RESET_ALL}")
+        lines.extend(_format_position(pos, _MY_POSITION_TMPL, 45) for pos in top_positions)
+    lines.append("")
+    _print_safe("\n".join(lines), stream=sys.stdout)
+
+
+def _position_templates(indent: str) -> Tuple[str, str]:
+    # (non-negative PnL, negative PnL) %-templates for the three lines shown
+    # per position; color codes and layout are baked in once at import.
+    head = f"{indent}%s - {Style.DIM}%s{Style.RESET_ALL}\n{indent}  Value: $%.2f | PnL: "
+    tail = f"{Style.RESET_ALL}\n{indent}  Bought @ %.1f¢ | Current @ %.1f¢"
+    return head + f"{Fore.CYAN}+%.1f%%" + tail, head + f"{Fore.RED}%.1f%%" + tail
+
+
+_MY_POSITION_TMPL = _position_templates("  ")
+_TRADER_POSITION_TMPL = _position_templates("    ")
+
+
+def _format_position(pos: dict, templates: Tuple[str, str], title_width: int) -> str:
+    title = pos.get("title", "") or ""
+    if len(title) > title_width:
+        title = title[:title_width] + "..."
+    pnl_value = pos.get("percentPnl", 0)
+    return (templates[0] if pnl_value >= 0 else templates[1]) % (
+        pos.get("outcome", ""),
+        title,
+        pos.get("currentValue", 0),
+        pnl_value,
+        pos.get("avgPrice", 0) * 100,
+        pos.get("curPrice", 0) * 100,
+    )
 
 
 def traders_positions(
@@ -483,7 +764,9 @@ def traders_positions(
     position_details: Optional[List[List[dict]]] = None,
     profitabilities: Optional[List[float]] = None,
 ) -> None:
-    if _log_format() == "json":
+    if not _INFO_ENABLED:
+        return
+    if _LOG_FORMAT_IS_JSON:
         _emit(
             "info",
             "TRADERS_POSITIONS",
@@ -496,8 +779,10 @@ def traders_positions(
         )
         return
 
-    _print_safe(f"\n{Fore.CYAN}{Style.BRIGHT}Traders You Are Copying{Style.RESET_ALL}", stream=sys.stdout)
-    _print_safe(f"{Fore.CYAN}{'-' * 70}{Style.RESET_ALL}", stream=sys.stdout)
+    lines = [
+        f"\n{Fore.CYAN}{Style.BRIGHT}Traders You Are Copying{Style.RESET_ALL}",
+        f"{Fore.CYAN}{_RULE_DASH}{Style.RESET_ALL}",
+    ]
 
     for idx, address in enumerate(traders):
         count = position_counts[idx]
@@ -510,22 +795,9 @@ def traders_positions(
             pnl_color = Fore.GREEN if pnl >= 0 else Fore.RED
             profit_str = f" | PnL: {pnl_color}{pnl_sign}{pnl:.1f}%{Style.RESET_ALL}"
 
-        _print_safe(f"  {Style.DIM}{format_address(address)}{Style.RESET_ALL}: {count_str}{profit_str}", stream=sys.stdout)
+        lines.append(f"  {Style.DIM}{format_address(address)}{Style.RESET_ALL}: {count_str}{profit_str}")
 
         if position_details and position_details[idx]:
-            for pos in position_details[idx]:
-                pnl_sign2 = "+" if pos.get("percentPnl", 0) >= 0 else ""
-                avg_price = pos.get("avgPrice", 0)
-                cur_price = pos.get("curPrice", 0)
-                title = (pos.get("title", "") or "")[:40]
-                if len(pos.get("title", "") or "") > 40:
-                    title += "..."
-                _print_safe(f'    {pos.get("outcome", "")} - {Style.DIM}{title}{Style.RESET_ALL}', stream=sys.stdout)
-                pnl_value = pos.get("percentPnl", 0)
-                pnl_color_pos = Fore.CYAN if pnl_value >= 0 else Fore.RED
-                _print_safe(
-                    f'      Value: ${pos.get("currentValue", 0):.2f} | PnL: {pnl_color_pos}{pnl_sign2}{pnl_value:.1f}%{Style.RESET_ALL}',
-                    stream=sys.stdout,
-                )
-                _print_safe(f"      Bought @ {(avg_price * 100):.1f}¢ | Current @ {(cur_price * 100):.1f}¢", stream=sys.stdout)
-    _print_safe("", stream=sys.stdout)
\ No newline at end of file
+            lines.extend(_format_position(pos, _TRADER_POSITION_TMPL, 40) for pos in position_details[idx])
+    lines.append("")
+    _print_safe("\n".join(lines), stream=sys.stdout)
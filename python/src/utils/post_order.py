@@ -5,7 +5,7 @@ from typing import Optional, Dict, Any
 from ..config.env import ENV
 from ..models.user_history import get_user_activity_collection
 from ..utils.logger import info, warning, order_result
-from ..config.copy_strategy import calculate_order_size, get_trade_multiplier
+from ..config.copy_strategy import calculate_order_size, get_trade_multiplier, OrderSizeCalculation
 
 RETRY_LIMIT = ENV.RETRY_LIMIT
 COPY_STRATEGY_CONFIG = ENV.COPY_STRATEGY_CONFIG
@@ -52,6 +52,38 @@ def is_insufficient_balance_or_allowance_error(message: Optional[str]) -> bool:
     return 'not enough balance' in lower or 'allowance' in lower
 
 
+def size_buy_order(
+    trade: Dict[str, Any],
+    my_position: Optional[Dict[str, Any]],
+    my_balance: float
+) -> OrderSizeCalculation:
+    """
+    Size the BUY copying trade with the copy strategy (and log the reasoning)
+
+    Callers placing several orders from one balance size each one up front
+    and hand the result to post_order(order_calc=...).
+    """
+    info('Executing BUY strategy...')
+    
+    info(f'Your balance: ${my_balance:.2f}')
+    info(f'Trader bought: ${trade.get("usdcSize", 0):.2f}')
+    
+    # Get current position size for position limit checks
+    current_position_value = (my_position.get('size', 0) * my_position.get('avgPrice', 0)) if my_position else 0
+    
+    # Use new copy strategy system
+    order_calc = calculate_order_size(
+        COPY_STRATEGY_CONFIG,
+        trade.get('usdcSize', 0),
+        my_balance,
+        current_position_value
+    )
+    
+    # Log the calculation reasoning
+    info(f'{order_calc.reasoning}')
+    return order_calc
+
+
 async def post_order(
     clob_client: Any,
     condition: str,
@@ -60,9 +92,16 @@ async def post_order(
     trade: Dict[str, Any],
     my_balance: float,
     user_balance: float,
-    user_address: str
-):
-    """Post order to Polymarket"""
+    user_address: str,
+    order_calc: Optional[OrderSizeCalculation] = None
+) -> float:
+    """
+    Post order to Polymarket
+
+    order_calc: BUY size from size_buy_order(); computed here when omitted.
+    Returns the USDC spent (BUY orders; 0 for everything else) so callers
+    placing several orders from one balance snapshot can keep it current.
+    """
     collection = get_user_activity_collection(user_address)
     
     if condition == 'merge':
@@ -70,7 +109,7 @@ async def post_order(
         if not my_position:
             warning('No position to merge')
             collection.update_one({'_id': trade['_id']}, {'$set': {'bot': True}})
-            return
+            return 0.0
         
         remaining = my_position.get('size', 0)
         
@@ -78,7 +117,7 @@ async def post_order(
         if remaining < MIN_ORDER_SIZE_TOKENS:
             warning(f'Position size ({remaining:.2f} tokens) too small to merge - skipping')
             collection.update_one({'_id': trade['_id']}, {'$set': {'bot': True}})
-            return
+            return 0.0
         
         retry = 0
         abort_due_to_funds = False
@@ -135,7 +174,7 @@ async def post_order(
                 {'_id': trade['_id']},
                 {'$set': {'bot': True, 'botExcutedTime': RETRY_LIMIT}}
             )
-            return
+            return 0.0
         
         if retry >= RETRY_LIMIT:
             collection.update_one(
@@ -146,24 +185,8 @@ async def post_order(
             collection.update_one({'_id': trade['_id']}, {'$set': {'bot': True}})
     
     elif condition == 'buy':
-        info('Executing BUY strategy...')
-        
-        info(f'Your balance: ${my_balance:.2f}')
-        info(f'Trader bought: ${trade.get("usdcSize", 0):.2f}')
-        
-        # Get current position size for position limit checks
-        current_position_value = (my_position.get('size', 0) * my_position.get('avgPrice', 0)) if my_position else 0
-        
-        # Use new copy strategy system
-        order_calc = calculate_order_size(
-            COPY_STRATEGY_CONFIG,
-            trade.get('usdcSize', 0),
-            my_balance,
-            current_position_value
-        )
-        
-        # Log the calculation reasoning
-        info(f'{order_calc.reasoning}')
+        if order_calc is None:
+            order_calc = size_buy_order(trade, my_position, my_balance)
         
         # Check if order should be executed
         if order_calc.final_amount == 0:
@@ -171,10 +194,13 @@ async def post_order(
             if order_calc.below_minimum:
                 warning('Increase COPY_SIZE or wait for larger trades')
             collection.update_one({'_id': trade['_id']}, {'$set': {'bot': True}})
-            return
+            return 0.0
         
         remaining = order_calc.final_amount
         available_balance = my_balance  # Track remaining balance after orders
+        # Orders for different markets can be in flight together; name the market on
+        # every line logged after an await so interleaved output stays attributable
+        market = trade.get('slug') or trade.get('asset', 'unknown')
         
         retry = 0
         abort_due_to_funds = False
@@ -184,17 +210,17 @@ async def post_order(
             try:
                 order_book = await clob_client.get_order_book(trade['asset'])
                 if not order_book.get('asks') or len(order_book['asks']) == 0:
-                    warning('No asks available in order book')
+                    warning(f'{market}: No asks available in order book')
                     collection.update_one({'_id': trade['_id']}, {'$set': {'bot': True}})
                     break
                 
                 min_price_ask = min(order_book['asks'], key=lambda x: float(x['price']))
                 
-                info(f'Best ask: {min_price_ask["size"]} @ ${min_price_ask["price"]}')
+                info(f'{market}: Best ask: {min_price_ask["size"]} @ ${min_price_ask["price"]}')
                 
                 # Check if remaining amount is below minimum before creating order
                 if remaining < MIN_ORDER_SIZE_USD:
-                    info(f'Remaining amount (${remaining:.2f}) below minimum - completing trade')
+                    info(f'{market}: Remaining amount (${remaining:.2f}) below minimum - completing trade')
                     collection.update_one(
                         {'_id': trade['_id']},
                         {'$set': {'bot': True, 'myBoughtSize': total_bought_tokens}}
@@ -206,7 +232,7 @@ async def post_order(
                 
                 # Ensure minimum order size is 1 USDC
                 if order_size < MIN_ORDER_SIZE_USD:
-                    info(f'Order size (${order_size:.2f}) below minimum (${MIN_ORDER_SIZE_USD}) - completing trade')
+                    info(f'{market}: Order size (${order_size:.2f}) below minimum (${MIN_ORDER_SIZE_USD}) - completing trade')
                     collection.update_one(
                         {'_id': trade['_id']},
                         {'$set': {'bot': True, 'myBoughtSize': total_bought_tokens}}
@@ -215,7 +241,7 @@ async def post_order(
                 
                 # Check if balance is sufficient for the order
                 if available_balance < order_size:
-                    warning(f'Insufficient balance: Need ${order_size:.2f} but only have ${available_balance:.2f}')
+                    warning(f'{market}: Insufficient balance: Need ${order_size:.2f} but only have ${available_balance:.2f}')
                     abort_due_to_funds = True
                     break
                 
@@ -226,7 +252,7 @@ async def post_order(
                     'price': float(min_price_ask['price']),
                 }
                 
-                info(f'Creating order: ${order_size:.2f} @ ${min_price_ask["price"]} (Balance: ${available_balance:.2f})')
+                info(f'{market}: Creating order: ${order_size:.2f} @ ${min_price_ask["price"]} (Balance: ${available_balance:.2f})')
                 
                 signed_order = await clob_client.create_market_order(order_args)
                 resp = await clob_client.post_order(signed_order, 'FOK')
@@ -237,7 +263,7 @@ async def post_order(
                     total_bought_tokens += tokens_bought
                     order_result(
                         True,
-                        f'Bought ${order_args["amount"]:.2f} at ${order_args["price"]} ({tokens_bought:.2f} tokens)'
+                        f'{market}: Bought ${order_args["amount"]:.2f} at ${order_args["price"]} ({tokens_bought:.2f} tokens)'
                     )
                     remaining -= order_args['amount']
                     # Update balance after successful order
@@ -246,21 +272,21 @@ async def post_order(
                     error_message = extract_order_error(resp)
                     if is_insufficient_balance_or_allowance_error(error_message):
                         abort_due_to_funds = True
-                        warning(f'Order rejected: {error_message or "Insufficient balance or allowance"}')
+                        warning(f'{market}: Order rejected: {error_message or "Insufficient balance or allowance"}')
                         warning('Skipping remaining attempts. Top up funds or check allowance before retrying.')
                         break
                     retry += 1
-                    warning(f'Order failed (attempt {retry}/{RETRY_LIMIT}){f" - {error_message}" if error_message else ""}')
+                    warning(f'{market}: Order failed (attempt {retry}/{RETRY_LIMIT}){f" - {error_message}" if error_message else ""}')
             except Exception as e:
                 retry += 1
-                warning(f'Order error (attempt {retry}/{RETRY_LIMIT}): {e}')
+                warning(f'{market}: Order error (attempt {retry}/{RETRY_LIMIT}): {e}')
         
         if abort_due_to_funds:
             collection.update_one(
                 {'_id': trade['_id']},
                 {'$set': {'bot': True, 'botExcutedTime': RETRY_LIMIT}}
             )
-            return
+            return order_calc.final_amount - remaining
         
         if retry >= RETRY_LIMIT:
             collection.update_one(
@@ -272,6 +298,7 @@ async def post_order(
                 {'_id': trade['_id']},
                 {'$set': {'bot': True, 'myBoughtSize': total_bought_tokens}}
             )
+        return order_calc.final_amount - remaining
     
     elif condition == 'sell':
         # SELL strategy - similar to merge but different logic
@@ -280,3 +307,4 @@ async def post_order(
         # This would be implemented based on the full TypeScript version
         collection.update_one({'_id': trade['_id']}, {'$set': {'bot': True}})
 
+    return 0.0